@@ -4,10 +4,11 @@ Main entry point for the Wordle Solver program.
 Prompts user to choose a mode and executes the solver.
 """
 
-from wordle_solver.loader import load_word_list
-from wordle_solver.interface import get_opener_guesses, select_game_mode
+from wordle_solver.registry import get_dictionary
+from wordle_solver.interface import get_opener_guesses, select_game_mode, select_hard_mode
 from wordle_solver.modes.multi_solver import play_multi_solver
 from wordle_solver.test_suite import test_solver_on_all_words
+from wordle_solver.transposition import open_transposition_table
 from wordle_solver.modes.sequence_solver import play_sequence_solver
 
 def get_number_of_words():
@@ -21,30 +22,32 @@ def get_number_of_words():
         except ValueError:
             print("\u274c Please enter a valid number.")
 
-def handle_test_mode(opener_guesses, word_list):
+def handle_test_mode(opener_guesses, dictionary, hard_mode=False, table=None):
     """Run the test suite and skip interactive gameplay."""
-    test_solver_on_all_words(opener_guesses, word_list)
+    test_solver_on_all_words(opener_guesses, dictionary, hard_mode, table=table)
 
-def play_selected_mode(mode, num_words, opener_guesses, word_list):
+def play_selected_mode(mode, num_words, opener_guesses, dictionary, hard_mode=False, table=None):
     """Run the game loop for the selected mode."""
     solver_function = play_multi_solver if mode == '1' else play_sequence_solver
-    while solver_function(num_words, opener_guesses, word_list):
+    while solver_function(num_words, opener_guesses, dictionary, hard_mode, table):
         pass  # Replay until user exits
 
 def choose_and_play_mode():
     """Handles game mode selection and dispatch."""
-    word_list = load_word_list()
+    dictionary = get_dictionary()
+    table = open_transposition_table()
 
     while True:
         mode = select_game_mode()
         opener_guesses = get_opener_guesses()
+        hard_mode = select_hard_mode()
 
         if mode == '3':
-            handle_test_mode(opener_guesses, word_list)
+            handle_test_mode(opener_guesses, dictionary, hard_mode, table)
             continue
 
         num_words = get_number_of_words()
-        play_selected_mode(mode, num_words, opener_guesses, word_list)
+        play_selected_mode(mode, num_words, opener_guesses, dictionary, hard_mode, table)
 
 def main():
     """Main interactive loop to replay or exit."""
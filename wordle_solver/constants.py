@@ -5,7 +5,18 @@ Constants for the Wordle Solver project.
 
 WORD_LENGTH = 5  # Number of letters in each Wordle word
 WIN_FEEDBACK = 'g' * WORD_LENGTH  # The feedback string representing a win (all greens)
-WORD_LIST_PATH = "wordle_words.csv"  # Default path to the word list CSV
+WORD_LIST_PATH = "wordle_words.csv"  # Default path to the word list CSV (possible answers)
+ALLOWED_GUESSES_PATH = None  # Optional CSV of extra allowed guesses; None means guesses = answers
+ENDGAME_THRESHOLD = 30  # Boards with this many candidates or fewer get an exact endgame search (0 disables it)
+ENDGAME_TIME_BUDGET = 0.25  # Seconds an endgame search may take before falling back to the heuristic
+ENDGAME_NODE_LIMIT = 500  # Candidate sets a benchmark endgame search may expand (deterministic stand-in for the budget)
+ENDGAME_MEMO_MAX_ENTRIES = 100_000  # Candidate sets memoized by the endgame search before its memo is cleared
+DICTIONARY_MEMORY_BUDGET = 256 * 1024 * 1024  # Approximate bytes of loaded dictionaries kept by the registry
+MAX_GUESSES = 6  # Guesses allowed per word in simulated games (like Wordle rules)
+RESULTS_DIR = "results"  # Directory for test-suite results and reports
+SCORING_STRATEGY = "frequency"  # Default guess scorer: "frequency" or "positional"
+TRANSPOSITION_TABLE_PATH = None  # Optional SQLite file caching next-guess results across processes
+TRANSPOSITION_TABLE_MAX_ENTRIES = 100_000  # Entries kept before least recently used ones are evicted
 FEEDBACK_OPTIONS = ['g', 'y', 'b']  # Valid feedback characters: green, yellow, black
 FEEDBACK_MAP = {
     'g': 'green',
@@ -0,0 +1,198 @@
+# endgame.py
+"""
+Exact endgame search for small candidate sets.
+Once a board is down to a few dozen candidates, finds the guess that
+minimizes the expected number of guesses still needed (every candidate
+equally likely). The search is memoized on the candidate bitset, prunes
+guesses against the best total found so far, and gives up when it runs past
+its time budget so the caller can fall back to the heuristic scorer.
+
+A node limit can replace the time budget where results must not depend on
+machine speed or on what was searched before (benchmarks): such a search
+memoizes into its own table, so the nodes it expands, and whether it gives
+up, depend only on the candidate set.
+"""
+
+import sys
+import time
+import numpy as np
+from wordle_solver.constants import ENDGAME_TIME_BUDGET, ENDGAME_MEMO_MAX_ENTRIES
+from wordle_solver.indexing import encode_words, words_from_mask
+from wordle_solver.kernels import feedback_matrix, WIN_CODE
+
+
+class _OutOfTime(Exception):
+    """Raised inside the search when the time budget or node limit is spent."""
+
+
+class EndgameSolver:
+    """
+    Exact expected-guesses search over one board's remaining candidates.
+    Results for fully searched candidate sets are memoized and shared by every
+    caller, so one instance can serve many games (and threads) on a dictionary.
+
+    In normal mode any allowed guess is considered. In hard mode only the
+    remaining candidates are, since those are always consistent with the hints.
+    """
+
+    def __init__(self, dictionary, hard_mode=False, backend=None, max_entries=ENDGAME_MEMO_MAX_ENTRIES):
+        """
+        Prepares the search for a dictionary.
+
+        Args:
+            dictionary (Mapping): Dictionary from load_dictionary or the registry.
+            hard_mode (bool): If True, only consider guesses that are still candidates.
+            backend (str | None): Kernel backend for feedback codes (see kernels.py).
+            max_entries (int): Memoized candidate sets kept before the memo is cleared.
+        """
+        self.dictionary = dictionary
+        self.hard_mode = hard_mode
+        self.backend = backend
+        self.max_entries = max_entries
+        self._guesses = None if hard_mode else encode_words(dictionary["guesses"])
+        word = encode_words(dictionary["answers"][:1])
+        feedback_matrix(word, word, backend)  # Load the compiled kernel now rather than during a search
+        self._memo = {}  # candidate mask -> (total guesses over all candidates, best guess)
+        self._limited = {}  # (candidate mask, node limit) -> best_guess result of a node-limited search
+
+    def memo_size(self):
+        """
+        Measures the memo shared by every caller.
+
+        Returns:
+            tuple[int, int]: Memoized candidate sets, and the bytes held by the memo table,
+                its mask keys and result tuples (guess words belong to the dictionary).
+        """
+        memo = dict(self._memo)  # Copy, in case another thread is inserting
+        size = sys.getsizeof(memo)
+        for key, result in memo.items():
+            size += sys.getsizeof(key) + sys.getsizeof(result) + sys.getsizeof(result[0])
+        return len(memo), size
+
+    def best_guess(self, candidate_mask, is_legal=None, time_budget=ENDGAME_TIME_BUDGET, node_limit=None):
+        """
+        Finds the guess that minimizes the expected number of guesses to solve a board.
+
+        Args:
+            candidate_mask (int): Board's remaining candidates, as a mask over the answer index.
+            is_legal (Callable[[str], bool] | None): Extra restriction on the first guess (hard mode).
+            time_budget (float | None): Seconds the search may take, or None for no time limit.
+            node_limit (int | None): Candidate sets the search may expand, or None to use the shared
+                memo and the time budget alone.
+
+        Returns:
+            tuple[str, float] | None: (guess, expected guesses including this one), or None if
+                there are no candidates, no legal guess, or the search ran out of time or nodes.
+        """
+        answer_index = self.dictionary["answer_index"]
+        words = words_from_mask(answer_index, candidate_mask)
+        if not words:
+            return None
+
+        if self.hard_mode:
+            guess_words = [word for word in words if is_legal is None or is_legal(word)]
+            if not guess_words:
+                return None
+            guesses = encode_words(guess_words)
+        else:
+            guess_words = self.dictionary["guesses"]
+            guesses = self._guesses
+
+        positions = answer_index["positions"]
+        search = {
+            "words": words,
+            "guess_words": guess_words,
+            "bits": [1 << positions[word] for word in words],
+            "codes": feedback_matrix(guesses, encode_words(words), self.backend),
+            # A restricted first guess changes the answer, so only memoize the unrestricted search
+            "memoize": len(guess_words) == len(words) or not self.hard_mode,
+            "memo": self._memo if node_limit is None else {},
+            "nodes": 0,
+            "node_limit": node_limit,
+        }
+
+        # Node-limited results depend only on the candidate set, so they can be reused as a whole
+        limited_key = (candidate_mask, node_limit) if node_limit is not None and search["memoize"] else None
+        if limited_key in self._limited:
+            return self._limited[limited_key]
+        # The budget covers the search only: the first kernel call in a process pays Numba's start-up
+        search["deadline"] = None if time_budget is None else time.perf_counter() + time_budget
+        try:
+            total, guess = self._search(search, np.arange(len(words)))
+            result = guess, total / len(words)
+        except _OutOfTime:
+            if search["deadline"] is not None and time.perf_counter() > search["deadline"]:
+                return None  # Ran out of time, which says nothing about the candidate set
+            result = None
+        if limited_key is not None:
+            if len(self._limited) >= self.max_entries:
+                self._limited.clear()
+            self._limited[limited_key] = result
+        return result
+
+    def _search(self, search, cols):
+        """
+        Returns (total guesses over all candidates in cols, best guess).
+        Buckets of one or two candidates are solved directly: guess one, then the other.
+        """
+        words = search["words"]
+        n = len(cols)
+        if n <= 2:
+            return 2 * n - 1, words[cols[0]]
+
+        key = sum(search["bits"][c] for c in cols)
+        memo = search["memo"]
+        if search["memoize"]:
+            hit = memo.get(key)
+            if hit is not None:
+                return hit
+        if search["deadline"] is not None and time.perf_counter() > search["deadline"]:
+            raise _OutOfTime
+        search["nodes"] += 1
+        if search["node_limit"] is not None and search["nodes"] > search["node_limit"]:
+            raise _OutOfTime
+
+        codes = search["codes"][:, cols]
+        ordered = np.sort(codes, axis=1)
+        distinct = 1 + np.count_nonzero(np.diff(ordered, axis=1), axis=1)
+        win = ordered[:, -1] == WIN_CODE  # WIN_CODE is the largest code
+
+        # Lower bound: each non-winning bucket of k words needs at least 2k - 1 more guesses
+        lower = 3 * n - win - distinct
+        useful = distinct > 1
+        if self.hard_mode:
+            useful &= win  # Only words still in the candidate set stay legal
+        rows = np.flatnonzero(useful)
+        rows = rows[np.lexsort((~win[rows], lower[rows]))]
+
+        best_total, best_row = float("inf"), None
+        for row in rows:
+            bound = int(lower[row])
+            if bound >= best_total:
+                break  # Rows are sorted by lower bound, so none of the rest can do better
+
+            buckets = {}
+            for col, code in zip(cols, codes[row]):
+                if code != WIN_CODE:
+                    buckets.setdefault(code, []).append(col)
+
+            total = bound
+            for bucket in sorted(buckets.values(), key=len, reverse=True):
+                if len(bucket) <= 2:
+                    break  # Lower bound is exact from here on
+                total += self._search(search, np.array(bucket))[0] - (2 * len(bucket) - 1)
+                if total >= best_total:
+                    break
+            if total < best_total:
+                best_total, best_row = total, row
+
+        if best_row is None:
+            # No guess splits the candidates (only possible in hard mode): guess them one by one
+            result = n * (n + 1) // 2, words[cols[0]]
+        else:
+            result = best_total, search["guess_words"][best_row]
+        if search["memoize"]:
+            if len(memo) >= self.max_entries:
+                memo.clear()
+            memo[key] = result
+        return result
@@ -5,6 +5,7 @@ Filters candidate words based on a guess and feedback.
 
 from wordle_solver.constants import WORD_LENGTH
 from wordle_solver.helpers import normalize_feedback
+from wordle_solver.indexing import words_from_mask
 
 def filter_words_for_word(words, guess, feedback):
     feedback = normalize_feedback(feedback)
@@ -77,3 +78,77 @@ def filter_words_for_word(words, guess, feedback):
 
 
     return new_words
+
+
+def constraint_mask(index, guess, feedback):
+    """
+    Builds the mask of indexed words consistent with one guess and its feedback.
+    Applies the same rules as filter_words_for_word, using the index's bitmasks.
+
+    Args:
+        index (dict): Index built by build_word_index.
+        guess (str): The guessed word.
+        feedback (str): Feedback string for the guess.
+
+    Returns:
+        int: Bitmask of matching words.
+    """
+    feedback = normalize_feedback(feedback)
+    all_mask = index["all_mask"]
+    position = index["position"]
+    min_count = index["min_count"]
+    mask = all_mask
+
+    # Greens lock positions, yellows ban the letter in that spot
+    for i in range(WORD_LENGTH):
+        if feedback[i] == 'g':
+            mask &= position[i][guess[i]]
+        elif feedback[i] == 'y':
+            mask &= all_mask ^ position[i][guess[i]]
+
+    # Per-letter count constraints
+    for ch in set(guess):
+        colored = sum(1 for i in range(WORD_LENGTH) if guess[i] == ch and feedback[i] in ('g', 'y'))
+        blacks = sum(1 for i in range(WORD_LENGTH) if guess[i] == ch and feedback[i] == 'b')
+        if colored == 0:
+            mask &= all_mask ^ min_count[ch][1]
+        elif blacks > 0:
+            mask &= min_count[ch][colored] & ~min_count[ch][colored + 1]
+        else:
+            mask &= min_count[ch][colored]
+
+    return mask
+
+
+def filter_mask_for_word(index, mask, guess, feedback):
+    """
+    Narrows a candidate mask using a guess and its feedback.
+
+    Args:
+        index (dict): Index built by build_word_index.
+        mask (int): Current candidate bitmask.
+        guess (str): The guessed word.
+        feedback (str): Feedback string for the guess.
+
+    Returns:
+        int: The narrowed candidate bitmask.
+    """
+    return mask & constraint_mask(index, guess, feedback)
+
+
+def filter_word_slot(word_state, dictionary, guess, feedback):
+    """
+    Narrows a word slot's candidates using a guess and its feedback.
+    Slots that track a "legal_mask" (hard mode) have their legal guesses narrowed the same way.
+
+    Args:
+        word_state (dict): Word slot holding "candidate_mask" and "candidate_words"; updated in place.
+        dictionary (dict): Dictionary from load_dictionary.
+        guess (str): The guessed word.
+        feedback (str): Feedback string for the guess.
+    """
+    answer_index = dictionary["answer_index"]
+    word_state["candidate_mask"] = filter_mask_for_word(answer_index, word_state["candidate_mask"], guess, feedback)
+    word_state["candidate_words"] = words_from_mask(answer_index, word_state["candidate_mask"])
+    if "legal_mask" in word_state:
+        word_state["legal_mask"] = filter_mask_for_word(dictionary["guess_index"], word_state["legal_mask"], guess, feedback)
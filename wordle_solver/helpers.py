@@ -4,8 +4,7 @@ General utility functions used across the Wordle Solver.
 """
 
 from wordle_solver.constants import WORD_LENGTH
-from wordle_solver.scoring import score_words
-from collections import Counter
+from wordle_solver.scoring import score_words, get_top_scored_words
 
 def normalize_feedback(feedback):
     """
@@ -40,26 +39,6 @@ def get_feedback_input(label, guess):
         print(f"\u274c Invalid feedback. Please enter {WORD_LENGTH} characters.")
 
 
-def get_top_scored_words(word_list, past_guesses, top_n=1):
-    """
-    Selects the top-scoring word(s) from the candidate list, excluding any already guessed.
-
-    Args:
-        word_list (list[str]): List of candidate words.
-        past_guesses (list[str]): Words that have already been guessed.
-        top_n (int): Number of top words to return.
-
-    Returns:
-        list[str] or str: Top N scored words, or the best single word as string if top_n == 1.
-    """
-    scored = [
-        (word, score)
-        for word, score in score_words(word_list)
-        if word not in past_guesses
-    ]
-    return scored[:top_n] if top_n > 1 else (scored[0][0] if scored else None)
-
-
 def print_top_suggestions(label, word_list):
     """
     Prints the top 3 word suggestions for a given word slot.
@@ -72,18 +51,36 @@ def print_top_suggestions(label, word_list):
     print(f"{label}: " + ", ".join(f"{w} ({s})" for w, s in top))
 
 
-def score_words(words):
+def simulate_feedback(solution, guess):
     """
-    Scores words based on letter frequency across all candidate words.
+    Generates feedback string for a guess against the actual solution.
 
     Args:
-        words (list[str]): List of candidate words.
+        solution (str): The correct word.
+        guess (str): The guessed word.
 
     Returns:
-        list[tuple[str, int]]: Words sorted by score in descending order.
+        str: Feedback string in 'g', 'y', 'b' format.
     """
-    freq = Counter("".join(words))  # Frequency of each letter in the candidate list
-    scores = {}
-    for word in words:
-        scores[word] = sum(freq[c] for c in set(word))  # Score = sum of unique letter frequencies
-    return sorted(scores.items(), key=lambda x: x[1], reverse=True)
+
+    feedback = ['b'] * WORD_LENGTH  # Start with all gray
+    solution_chars = list(solution)
+    guess_chars = list(guess)
+    used = [False] * WORD_LENGTH  # Track used positions for yellow logic
+
+    # First pass: green (correct letter and position)
+    for i in range(WORD_LENGTH):
+        if guess_chars[i] == solution_chars[i]:
+            feedback[i] = 'g'
+            used[i] = True
+            solution_chars[i] = None  # Mark solution letter as used
+
+    # Second pass: yellow (correct letter, wrong position)
+    for i in range(WORD_LENGTH):
+        if feedback[i] == 'b' and guess_chars[i] in solution_chars:
+            idx = solution_chars.index(guess_chars[i])
+            if not used[idx]:
+                feedback[i] = 'y'
+                solution_chars[idx] = None  # Mark letter as used
+
+    return ''.join(feedback)
@@ -0,0 +1,116 @@
+# indexing.py
+"""
+Precomputed bitset indexes over a word list.
+Bit i of every mask stands for the i-th word of the indexed list.
+"""
+
+import numpy as np
+from string import ascii_lowercase
+from wordle_solver.constants import WORD_LENGTH
+
+def build_word_index(words):
+    """
+    Builds per-position and per-letter-count bitmasks for a word list.
+
+    Args:
+        words (list[str]): Words to index.
+
+    Returns:
+        dict: Index with keys:
+            "words" (list[str]): The indexed words, in bit order.
+            "positions" (dict[str, int]): Word -> bit position.
+            "all_mask" (int): Mask with one bit set per word.
+            "position" (list[dict[str, int]]): For each position, letter -> mask of words with that letter there.
+            "min_count" (dict[str, list[int]]): Letter -> masks of words containing the letter at least k times,
+                for k = 0 .. WORD_LENGTH + 1.
+    """
+    all_mask = (1 << len(words)) - 1
+    position = [{ch: 0 for ch in ascii_lowercase} for _ in range(WORD_LENGTH)]
+    min_count = {ch: [all_mask] + [0] * (WORD_LENGTH + 1) for ch in ascii_lowercase}
+
+    for i, word in enumerate(words):
+        bit = 1 << i
+        for pos, ch in enumerate(word):
+            position[pos][ch] |= bit
+        for ch in set(word):
+            for k in range(1, word.count(ch) + 1):
+                min_count[ch][k] |= bit
+
+    return {
+        "words": words,
+        "positions": {word: i for i, word in enumerate(words)},
+        "all_mask": all_mask,
+        "position": position,
+        "min_count": min_count,
+    }
+
+
+def words_from_mask(index, mask):
+    """
+    Lists the words whose bits are set in a mask.
+
+    Args:
+        index (dict): Index built by build_word_index.
+        mask (int): Bitmask over the indexed words.
+
+    Returns:
+        list[str]: Words in index order.
+    """
+    words = index["words"]
+    bits = bin(mask)[:1:-1]  # Least significant bit first
+    result = []
+    i = bits.find('1')
+    while i != -1:
+        result.append(words[i])
+        i = bits.find('1', i + 1)
+    return result
+
+
+def mask_from_words(index, words):
+    """
+    Builds a mask with the bits of the given words set.
+
+    Args:
+        index (dict): Index built by build_word_index.
+        words (list[str]): Words to include; words missing from the index are ignored.
+
+    Returns:
+        int: Bitmask over the indexed words.
+    """
+    positions = index["positions"]
+    mask = 0
+    for word in words:
+        i = positions.get(word)
+        if i is not None:
+            mask |= 1 << i
+    return mask
+
+
+def mask_contains(index, mask, word):
+    """
+    Checks whether a word's bit is set in a mask.
+
+    Args:
+        index (dict): Index built by build_word_index.
+        mask (int): Bitmask over the indexed words.
+        word (str): Word to look up.
+
+    Returns:
+        bool: True if the word is indexed and its bit is set.
+    """
+    i = index["positions"].get(word)
+    return i is not None and (mask >> i) & 1 == 1
+
+
+def encode_words(words):
+    """
+    Encodes words as a (N, WORD_LENGTH) uint8 array of letter codes (a=0 .. z=25).
+
+    Args:
+        words (list[str]): Lowercase words.
+
+    Returns:
+        np.ndarray: Encoded words.
+    """
+    data = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (data - ord('a')).reshape(-1, WORD_LENGTH)
@@ -101,3 +101,13 @@ def select_game_mode():
         break  # Valid mode selected
 
     return mode
+
+
+def select_hard_mode():
+    """
+    Asks whether guesses must satisfy all revealed hints.
+
+    Returns:
+        bool: True if hard mode was chosen.
+    """
+    return input("🔒 Play in hard mode? (y/n): ").strip().lower() == 'y'
@@ -0,0 +1,305 @@
+# kernels.py
+"""
+Optional compiled kernels for feedback, filtering and scoring.
+Uses Numba when it is importable and falls back to the pure-Python
+reference implementations otherwise. Compiled kernels release the GIL,
+so several threads can run them in parallel.
+
+The solver uses feedback_matrix (endgame search) and score_words (frequency
+strategy); the test suite buckets answers with feedback_for_solutions. The
+solver filters candidates with the bitset indexes, so filter_words only
+serves callers holding plain word lists.
+"""
+
+import numpy as np
+from wordle_solver.constants import WORD_LENGTH
+from wordle_solver.filtering import filter_words_for_word
+from wordle_solver.helpers import normalize_feedback, simulate_feedback
+from wordle_solver.indexing import encode_words
+from wordle_solver.scoring import score_words as score_words_python
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+DEFAULT_BACKEND = "numba" if NUMBA_AVAILABLE else "python"
+FEEDBACK_CODES = {'b': 0, 'y': 1, 'g': 2}  # Per-position feedback encoding
+FEEDBACK_CHARS = "byg"
+FEEDBACK_BYTES = np.frombuffer(FEEDBACK_CHARS.encode("ascii"), dtype=np.uint8)
+UNUSED = 255  # Marks a consumed solution letter in the feedback kernel
+WIN_CODE = 3 ** WORD_LENGTH - 1  # Feedback code of an all-green row
+
+
+def encode_feedback(feedback):
+    """
+    Encodes a feedback string as a uint8 array using FEEDBACK_CODES.
+
+    Args:
+        feedback (str): Feedback string; gray aliases are normalized.
+
+    Returns:
+        np.ndarray: Encoded feedback of length WORD_LENGTH.
+    """
+    return np.array([FEEDBACK_CODES[c] for c in normalize_feedback(feedback)], dtype=np.uint8)
+
+
+def decode_feedback(codes):
+    """
+    Decodes an encoded feedback row back into a 'g'/'y'/'b' string.
+
+    Args:
+        codes (np.ndarray): Encoded feedback of length WORD_LENGTH.
+
+    Returns:
+        str: Feedback string.
+    """
+    return ''.join(FEEDBACK_CHARS[c] for c in codes)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nogil=True, cache=True)
+    def _feedback_kernel(solutions, guess, out):
+        remaining = np.empty(WORD_LENGTH, dtype=np.uint8)
+        for n in range(solutions.shape[0]):
+            # First pass: greens consume their solution letter
+            for i in range(WORD_LENGTH):
+                if guess[i] == solutions[n, i]:
+                    out[n, i] = 2
+                    remaining[i] = UNUSED
+                else:
+                    out[n, i] = 0
+                    remaining[i] = solutions[n, i]
+            # Second pass: yellows consume the first matching unused letter
+            for i in range(WORD_LENGTH):
+                if out[n, i] == 0:
+                    for j in range(WORD_LENGTH):
+                        if remaining[j] == guess[i]:
+                            out[n, i] = 1
+                            remaining[j] = UNUSED
+                            break
+
+    @njit(nogil=True, cache=True)
+    def _feedback_matrix_kernel(guesses, solutions, out):
+        remaining = np.empty(WORD_LENGTH, dtype=np.uint8)
+        colors = np.empty(WORD_LENGTH, dtype=np.uint8)
+        for g in range(guesses.shape[0]):
+            for n in range(solutions.shape[0]):
+                # Same two passes as _feedback_kernel
+                for i in range(WORD_LENGTH):
+                    if guesses[g, i] == solutions[n, i]:
+                        colors[i] = 2
+                        remaining[i] = UNUSED
+                    else:
+                        colors[i] = 0
+                        remaining[i] = solutions[n, i]
+                for i in range(WORD_LENGTH):
+                    if colors[i] == 0:
+                        for j in range(WORD_LENGTH):
+                            if remaining[j] == guesses[g, i]:
+                                colors[i] = 1
+                                remaining[j] = UNUSED
+                                break
+                code = 0
+                for i in range(WORD_LENGTH):
+                    code = code * 3 + colors[i]
+                out[g, n] = code
+
+    @njit(nogil=True, cache=True)
+    def _filter_kernel(words, guess, feedback, out):
+        used = np.empty(WORD_LENGTH, dtype=np.bool_)
+        for n in range(words.shape[0]):
+            match = True
+            for i in range(WORD_LENGTH):
+                used[i] = False
+
+            # 1) Greens: lock positions
+            for i in range(WORD_LENGTH):
+                if feedback[i] == 2:
+                    if words[n, i] != guess[i]:
+                        match = False
+                        break
+                    used[i] = True
+
+            # 2) Yellows: ban the letter in that spot
+            if match:
+                for i in range(WORD_LENGTH):
+                    if feedback[i] == 1 and words[n, i] == guess[i]:
+                        match = False
+                        break
+
+            # 3) Yellows: the letter must exist in another unused slot
+            if match:
+                for i in range(WORD_LENGTH):
+                    if feedback[i] == 1:
+                        found = False
+                        for j in range(WORD_LENGTH):
+                            if j != i and not used[j] and words[n, j] == guess[i]:
+                                used[j] = True
+                                found = True
+                                break
+                        if not found:
+                            match = False
+                            break
+
+            # 4) Per-letter count constraints
+            if match:
+                for i in range(WORD_LENGTH):
+                    ch = guess[i]
+                    colored = 0
+                    blacks = 0
+                    for k in range(WORD_LENGTH):
+                        if guess[k] == ch:
+                            if feedback[k] == 0:
+                                blacks += 1
+                            else:
+                                colored += 1
+                    count = 0
+                    for k in range(WORD_LENGTH):
+                        if words[n, k] == ch:
+                            count += 1
+                    if colored == 0:
+                        ok = count == 0
+                    elif blacks > 0:
+                        ok = count == colored
+                    else:
+                        ok = count >= colored
+                    if not ok:
+                        match = False
+                        break
+
+            out[n] = match
+
+    @njit(nogil=True, cache=True)
+    def _score_kernel(words, guesses, out):
+        freq = np.zeros(26, dtype=np.int64)
+        for n in range(words.shape[0]):
+            for i in range(WORD_LENGTH):
+                freq[words[n, i]] += 1
+        seen = np.empty(26, dtype=np.bool_)
+        for n in range(guesses.shape[0]):
+            seen[:] = False
+            total = 0
+            for i in range(WORD_LENGTH):
+                ch = guesses[n, i]
+                if not seen[ch]:
+                    seen[ch] = True
+                    total += freq[ch]
+            out[n] = total
+
+
+def _resolve_backend(backend):
+    """Returns the backend to use, rejecting unknown or unavailable ones."""
+    backend = backend or DEFAULT_BACKEND
+    if backend not in ("numba", "python"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        raise ValueError("Numba backend requested but numba is not installed.")
+    return backend
+
+
+def feedback_for_solutions(solutions, guess, backend=None):
+    """
+    Generates the feedback a guess receives against each solution.
+
+    Args:
+        solutions (list[str]): Possible solutions.
+        guess (str): The guessed word.
+        backend (str | None): "numba", "python", or None for the best available.
+
+    Returns:
+        list[str]: Feedback string per solution, as simulate_feedback would return.
+    """
+    if _resolve_backend(backend) == "python":
+        return [simulate_feedback(solution, guess) for solution in solutions]
+    out = np.empty((len(solutions), WORD_LENGTH), dtype=np.uint8)
+    _feedback_kernel(encode_words(solutions), encode_words([guess])[0], out)
+    text = FEEDBACK_BYTES[out].tobytes().decode("ascii")
+    return [text[i:i + WORD_LENGTH] for i in range(0, len(text), WORD_LENGTH)]
+
+
+def feedback_matrix(guesses, solutions, backend=None):
+    """
+    Computes the feedback of every guess against every solution as base-3 codes
+    (each position's FEEDBACK_CODES digit, first letter most significant; WIN_CODE is all green).
+
+    Args:
+        guesses (np.ndarray): Encoded guesses from encode_words.
+        solutions (np.ndarray): Encoded solutions from encode_words.
+        backend (str | None): "numba", "python" (vectorized NumPy), or None for the best available.
+
+    Returns:
+        np.ndarray: uint8 array of shape (len(guesses), len(solutions)).
+    """
+    out = np.empty((guesses.shape[0], solutions.shape[0]), dtype=np.uint8)
+    if _resolve_backend(backend) == "numba":
+        _feedback_matrix_kernel(guesses, solutions, out)
+        return out
+
+    green = guesses[:, None, :] == solutions[None, :, :]
+    colors = np.where(green, 2, 0).astype(np.uint8)
+    rows, cols = np.indices(out.shape)
+
+    # Solution letters not matched by a green, counted per letter
+    counts = np.zeros(out.shape + (26,), dtype=np.uint8)
+    for j in range(WORD_LENGTH):
+        counts[rows, cols, solutions[cols, j]] += ~green[..., j]
+
+    # Yellows consume the remaining letters left to right
+    for i in range(WORD_LENGTH):
+        letters = guesses[rows, i]
+        yellow = ~green[..., i] & (counts[rows, cols, letters] > 0)
+        colors[..., i][yellow] = 1
+        counts[rows, cols, letters] -= yellow
+
+    out[:] = colors @ (3 ** np.arange(WORD_LENGTH - 1, -1, -1))
+    return out
+
+
+def filter_words(words, guess, feedback, backend=None):
+    """
+    Filters candidate words using a guess and its feedback.
+
+    Args:
+        words (list[str]): Candidate words.
+        guess (str): The guessed word.
+        feedback (str): Feedback string for the guess.
+        backend (str | None): "numba", "python", or None for the best available.
+
+    Returns:
+        list[str]: Words consistent with the feedback, as filter_words_for_word would return.
+    """
+    if _resolve_backend(backend) == "python":
+        return filter_words_for_word(words, guess, feedback)
+    out = np.empty(len(words), dtype=np.bool_)
+    _filter_kernel(encode_words(words), encode_words([guess])[0], encode_feedback(feedback), out)
+    return [word for word, keep in zip(words, out) if keep]
+
+
+def score_words(words, guesses=None, backend=None):
+    """
+    Scores words based on letter frequency across all candidate words.
+
+    Args:
+        words (list[str]): List of candidate words.
+        guesses (list[str] | None): Words to score; defaults to the candidates themselves.
+        backend (str | None): "numba", "python", or None for the best available.
+
+    Returns:
+        list[tuple[str, int]]: Words sorted by score in descending order, as scoring.score_words would return.
+    """
+    if _resolve_backend(backend) == "python" or not words:
+        return score_words_python(words, guesses)
+    guesses = words if guesses is None else guesses
+    unique = list(dict.fromkeys(guesses))  # Same de-duplication as the reference dict
+    out = np.empty(len(unique), dtype=np.int64)
+    _score_kernel(encode_words(words), encode_words(unique), out)
+    order = np.argsort(-out, kind="stable")
+    return [(unique[i], int(out[i])) for i in order]
+
+
+COMPILED_SCORERS = {
+    "frequency": score_words,  # Strategy name (see scoring.SCORERS) -> drop-in scorer using the best backend
+}
@@ -1,10 +1,38 @@
 # loader.py
 """
-Handles loading the word list from a CSV file.
+Handles loading the word lists from CSV files.
 """
 
 import pandas as pd
-from wordle_solver.constants import WORD_LIST_PATH
+from collections.abc import Mapping
+from wordle_solver.constants import WORD_LENGTH, WORD_LIST_PATH, ALLOWED_GUESSES_PATH
+from wordle_solver.indexing import build_word_index
+from wordle_solver.transposition import fingerprint
+
+def clean_word_list(words, source="word list"):
+    """
+    Strips and lowercases entries, dropping any that are not WORD_LENGTH letters a-z.
+    The indexes, kernels and snapshots all assume such words.
+
+    Args:
+        words (Iterable): Raw entries.
+        source (str): Where the entries came from, for the report on skipped ones.
+
+    Returns:
+        list[str]: Valid words, in their original order.
+    """
+    cleaned = []
+    skipped = 0
+    for entry in words:
+        word = str(entry).strip().lower()
+        if len(word) == WORD_LENGTH and word.isascii() and word.isalpha():
+            cleaned.append(word)
+        else:
+            skipped += 1
+    if skipped:
+        print(f"⚠️ Skipped {skipped} entries in {source} that are not {WORD_LENGTH}-letter words.")
+    return cleaned
+
 
 def load_word_list(filepath=WORD_LIST_PATH):
     """
@@ -14,7 +42,94 @@ def load_word_list(filepath=WORD_LIST_PATH):
         filepath (str): Path to the CSV file.
 
     Returns:
-        list[str]: List of 5-letter lowercase words.
+        list[str]: List of 5-letter lowercase words; other entries are skipped.
+    """
+    df = pd.read_csv(filepath, header=None, dtype=str, keep_default_na=False, skip_blank_lines=True)
+    return clean_word_list(df[0], filepath)
+
+
+def load_word_lists(answers_path=WORD_LIST_PATH, guesses_path=ALLOWED_GUESSES_PATH):
+    """
+    Loads the possible answers and the allowed guesses.
+
+    Args:
+        answers_path (str): Path to the CSV of possible answers.
+        guesses_path (str | None): Path to a CSV of extra allowed guesses, or None.
+
+    Returns:
+        tuple[list[str], list[str]]: Answers, and allowed guesses (answers first, then extras).
+    """
+    answers = load_word_list(answers_path)
+    guesses = list(answers)
+    if guesses_path:
+        known = set(answers)
+        for word in load_word_list(guesses_path):
+            if word not in known:
+                known.add(word)
+                guesses.append(word)
+    return answers, guesses
+
+
+def build_dictionary(answers, guesses=None):
+    """
+    Bundles the answer and guess lists with their precomputed indexes.
+
+    Args:
+        answers (list[str]): Possible answers; candidate filtering runs over these.
+        guesses (list[str] | None): Allowed guesses; guess ranking runs over these. Defaults to answers.
+
+    Returns:
+        dict: Dictionary with "answers", "guesses", "answer_index" and "guess_index".
+    """
+    answer_index = build_word_index(answers)
+    guess_index = answer_index if guesses is None or guesses == answers else build_word_index(guesses)
+    return {
+        "answers": answers,
+        "guesses": guess_index["words"],
+        "answer_index": answer_index,
+        "guess_index": guess_index,
+    }
+
+
+def load_dictionary(answers_path=WORD_LIST_PATH, guesses_path=ALLOWED_GUESSES_PATH):
+    """
+    Loads both word lists and builds their indexes.
+
+    Args:
+        answers_path (str): Path to the CSV of possible answers.
+        guesses_path (str | None): Path to a CSV of extra allowed guesses, or None.
+
+    Returns:
+        dict: Dictionary as returned by build_dictionary.
+    """
+    return build_dictionary(*load_word_lists(answers_path, guesses_path))
+
+
+def as_dictionary(words):
+    """
+    Accepts either a loaded dictionary or a plain word list.
+
+    Args:
+        words (dict | list[str]): Dictionary from load_dictionary, or a list used as both answers and guesses.
+
+    Returns:
+        dict: Dictionary as returned by build_dictionary.
+    """
+    if isinstance(words, Mapping):
+        return words
+    return build_dictionary(clean_word_list(words))
+
+
+def dictionary_hash(dictionary):
+    """
+    Identifies a dictionary by its word lists, e.g. to check that saved results or snapshots
+    belong to it. The same lists hash the same however they were loaded (the registry's
+    content_hash, a hash of the source files, is only used to notice changed files).
+
+    Args:
+        dictionary (Mapping): Dictionary from load_dictionary or the registry.
+
+    Returns:
+        str: Hex digest.
     """
-    df = pd.read_csv(filepath, header=None)
-    return df[0].str.lower().tolist()
\ No newline at end of file
+    return fingerprint([*dictionary["answers"], "", *dictionary["guesses"]])
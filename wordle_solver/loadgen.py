@@ -0,0 +1,232 @@
+# loadgen.py
+"""
+Load generator for the solver core.
+Runs many simulated players against Solver sessions in parallel threads,
+with simulate_feedback standing in for the game host, and reports throughput,
+per-turn latency percentiles, the memory each game's session holds and the
+size of the shared endgame memo.
+
+Usage:
+    python -m wordle_solver.loadgen --games 500 --concurrency 16 --rate 50 --boards 1,2,4,8,16,32,64
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from wordle_solver.constants import SCORING_STRATEGY
+from wordle_solver.helpers import simulate_feedback
+from wordle_solver.registry import get_dictionary
+from wordle_solver.solver import Solver
+
+DEFAULT_BOARD_MIX = (1, 2, 4, 8, 16, 32, 64)  # Board counts drawn uniformly per game
+LOAD_OPENERS = ("arose", "linty")
+EXTRA_GUESSES = 5  # A game with n boards allows n + EXTRA_GUESSES guesses
+
+
+def session_state_size(session):
+    """
+    Estimates the memory a session holds on its own: the session, its boards,
+    lists and masks. Word strings are left out, since every session shares them
+    with the dictionary.
+
+    Args:
+        session (Session): Game to measure.
+
+    Returns:
+        int: Size in bytes.
+    """
+    size = sys.getsizeof(session) + sys.getsizeof(vars(session))
+    for words in (session.boards, session.past_guesses, session.pending):
+        size += sys.getsizeof(words)
+    for board in session.boards:
+        size += sys.getsizeof(board) + sys.getsizeof(board["candidate_words"])
+        size += sum(sys.getsizeof(board[key]) for key in ("candidate_mask", "legal_mask") if key in board)
+    return size
+
+
+def play_simulated_game(solver, solutions, max_guesses=None, track_memory=True):
+    """
+    Plays one game against the solver, answering every guess with simulate_feedback.
+
+    Args:
+        solver (Solver): Shared solver configuration.
+        solutions (list[str]): Hidden word per board.
+        max_guesses (int | None): Guess limit; defaults to boards + EXTRA_GUESSES.
+        track_memory (bool): If True, size the session after every turn (outside the timed part).
+
+    Returns:
+        dict: Game result with keys:
+            "boards" (int): Number of boards.
+            "solved" (bool): True if every board was guessed within the limit.
+            "guesses" (int): Guesses made.
+            "turn_latencies" (list[float]): Solver time per turn in seconds, excluding the host.
+            "peak_memory" (int | None): Largest session_state_size seen during the game, in bytes.
+    """
+    max_guesses = max_guesses or len(solutions) + EXTRA_GUESSES
+    session = solver.new_session(len(solutions))
+    latencies = []
+    peak_memory = session_state_size(session) if track_memory else None
+
+    while not session.is_complete() and session.guess_count < max_guesses:
+        start = time.perf_counter()
+        guess = session.next_guess()
+        elapsed = time.perf_counter() - start
+        if not guess:
+            break
+
+        # The host answers every board that is still in play
+        unsolved = session.unsolved()
+        feedback = [simulate_feedback(solutions[i], guess) for i in unsolved]
+
+        start = time.perf_counter()
+        session.record_guess(guess)
+        for i, board_feedback in zip(unsolved, feedback):
+            session.record_feedback(i, guess, board_feedback)
+        latencies.append(elapsed + time.perf_counter() - start)
+        if track_memory:
+            peak_memory = max(peak_memory, session_state_size(session))
+
+    return {
+        "boards": len(solutions),
+        "solved": session.is_complete(),
+        "guesses": session.guess_count,
+        "turn_latencies": latencies,
+        "peak_memory": peak_memory,
+    }
+
+
+def run_load(dictionary, games=200, concurrency=8, rate=None, board_mix=DEFAULT_BOARD_MIX,
+             openers=LOAD_OPENERS, hard_mode=False, strategy=SCORING_STRATEGY, seed=0, track_memory=True):
+    """
+    Runs simulated games in parallel and measures the solver under load.
+
+    Args:
+        dictionary (Mapping): Dictionary shared by every game.
+        games (int): Number of games to play.
+        concurrency (int): Games played at the same time (worker threads).
+        rate (float | None): Games started per second, or None to start them as fast as workers free up.
+        board_mix (Sequence[int]): Board counts to draw from for each game; repeat a count to weight it.
+        openers (Sequence[str]): Starting guesses.
+        hard_mode (bool): If True, every guess must satisfy all hints revealed so far.
+        strategy (str): Name of the scoring strategy.
+        seed (int): Seed for drawing board counts and solutions.
+        track_memory (bool): If True, size each game's session after every turn.
+
+    Returns:
+        dict: Report with game counts, throughput, latency percentiles (ms), memory per game
+            (mean and largest per-game peak, bytes) and the endgame memo size (entries, bytes).
+    """
+    solver = Solver(dictionary, openers, hard_mode=hard_mode, strategy=strategy)
+    solver.endgame  # Set up the endgame search (and load its kernel) before any turn is timed
+    rng = random.Random(seed)
+    answers = list(solver.dictionary["answers"])
+    plans = []
+    for _ in range(games):
+        boards = rng.choice(board_mix)
+        plans.append([rng.choice(answers) for _ in range(boards)])
+
+    lock = threading.Lock()
+    results = []
+
+    def worker(solutions):
+        result = play_simulated_game(solver, solutions, track_memory=track_memory)
+        with lock:
+            results.append(result)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = []
+        for n, solutions in enumerate(plans):
+            if rate:
+                # Open-loop arrivals: game n starts n / rate seconds in
+                delay = start + n / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append(pool.submit(worker, solutions))
+    wall_time = time.perf_counter() - start
+    for future in futures:
+        future.result()  # Surface errors raised inside games
+
+    latencies = np.array([t for result in results for t in result["turn_latencies"]]) * 1000
+    report = {
+        "games": len(results),
+        "solved": sum(result["solved"] for result in results),
+        "turns": int(latencies.size),
+        "wall_time": wall_time,
+        "games_per_second": len(results) / wall_time if wall_time else 0.0,
+        "turns_per_second": latencies.size / wall_time if wall_time else 0.0,
+        "latency_ms": {
+            label: float(np.percentile(latencies, q)) if latencies.size else 0.0
+            for label, q in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100))
+        },
+        "memory_per_game": None,
+        "max_memory_per_game": None,
+        "endgame_memo": solver.endgame.memo_size(),
+    }
+    if track_memory and results:
+        peaks = [result["peak_memory"] for result in results]
+        report["memory_per_game"] = float(np.mean(peaks))
+        report["max_memory_per_game"] = max(peaks)
+    return report
+
+
+def print_report(report, concurrency, rate):
+    """
+    Prints a load report.
+
+    Args:
+        report (dict): Report from run_load.
+        concurrency (int): Worker threads used.
+        rate (float | None): Target games per second, or None for unthrottled.
+    """
+    latency = report["latency_ms"]
+    print(f"\n📊 Load test: {report['games']} games, concurrency {concurrency}, "
+          f"rate {f'{rate:g}/s' if rate else 'unthrottled'}")
+    print(f"✅ Solved: {report['solved']}/{report['games']}")
+    print(f"⏱️ {report['wall_time']:.2f}s wall time: {report['games_per_second']:.1f} games/s, "
+          f"{report['turns_per_second']:.1f} turns/s")
+    print(f"Per-turn latency: p50 {latency['p50']:.2f} ms, p95 {latency['p95']:.2f} ms, "
+          f"p99 {latency['p99']:.2f} ms, max {latency['max']:.2f} ms")
+    if report["memory_per_game"] is not None:
+        print(f"🧠 Session memory: {report['memory_per_game'] / 1024:.1f} KiB per game on average, "
+              f"{report['max_memory_per_game'] / 1024:.1f} KiB at most")
+    entries, size = report["endgame_memo"]
+    print(f"🧠 Shared endgame memo: {entries} entries, {size / 1024 / 1024:.1f} MiB")
+
+
+def main(argv=None):
+    """Parses command-line arguments, runs the load test and prints the report."""
+    parser = argparse.ArgumentParser(description="Run simulated players against the solver and report latency.")
+    parser.add_argument("--games", type=int, default=200, help="number of games to play")
+    parser.add_argument("--concurrency", type=int, default=8, help="games played at the same time")
+    parser.add_argument("--rate", type=float, default=None, help="games started per second (default: unthrottled)")
+    parser.add_argument("--boards", default=",".join(map(str, DEFAULT_BOARD_MIX)),
+                        help="comma-separated board counts to draw from, e.g. 1,1,4,64")
+    parser.add_argument("--openers", default=",".join(LOAD_OPENERS), help="comma-separated opener guesses")
+    parser.add_argument("--dictionary", default="default", help="registered dictionary name or answers CSV path")
+    parser.add_argument("--strategy", default=SCORING_STRATEGY, help="scoring strategy")
+    parser.add_argument("--hard", action="store_true", help="play in hard mode")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--no-memory", action="store_true", help="skip sizing sessions after every turn (no per-game memory report)")
+    args = parser.parse_args(argv)
+
+    board_mix = [int(n) for n in args.boards.split(",")]
+    if any(n < 1 for n in board_mix):
+        parser.error("board counts must be at least 1")
+    openers = [word.strip().lower() for word in args.openers.split(",") if word.strip()]
+
+    report = run_load(
+        get_dictionary(args.dictionary), games=args.games, concurrency=args.concurrency, rate=args.rate,
+        board_mix=board_mix, openers=openers, hard_mode=args.hard, strategy=args.strategy, seed=args.seed,
+        track_memory=not args.no_memory
+    )
+    print_report(report, args.concurrency, args.rate)
+    return report
+
+
+if __name__ == "__main__":
+    main()
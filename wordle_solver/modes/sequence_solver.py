@@ -4,25 +4,24 @@ Sequential solver mode implementation.
 Solves one word at a time using shared guess feedback.
 """
 
-from wordle_solver.constants import WORD_LENGTH, WIN_FEEDBACK
-from wordle_solver.filtering import filter_words_for_word 
-from wordle_solver.helpers import normalize_feedback, get_top_scored_words, print_top_suggestions
-from collections import Counter
+from wordle_solver.constants import WORD_LENGTH
+from wordle_solver.helpers import print_top_suggestions
+from wordle_solver.solver import Solver
 
-def play_sequence_solver(num_words, opener_guesses, full_word_list):
+def play_sequence_solver(num_words, opener_guesses, dictionary, hard_mode=False, table=None):
     """
     Runs the sequential solver mode.
 
     Args:
         num_words (int): Number of words to solve.
-        opener_guesses (list[str]): List of opener guesses.
-        full_word_list (list[str]): Valid Wordle words.
+        opener_guesses (list[str]): List of opener guesses; not modified.
+        dictionary (dict | list[str]): Dictionary from load_dictionary, or a plain list of valid words.
+        hard_mode (bool): If True, every guess must satisfy all hints revealed for the current word.
+        table (TranspositionTable | None): Shared cache of next-guess results.
     """
-    
-    # Initialize word slots with metadata for each word
-    word_slots = [{"label": f"Word {i+1}", "candidate_words": full_word_list.copy(), "solved": False} for i in range(num_words)]
 
-    past_guesses = []       # Stores all past guesses made
+    # Initialize game state with one board per word
+    session = Solver(dictionary, opener_guesses, hard_mode=hard_mode, table=table).new_session(num_words)
     guess_count = 0         # Total number of guesses
     current_index = 0       # Index of current word being solved
 
@@ -33,14 +32,12 @@ def play_sequence_solver(num_words, opener_guesses, full_word_list):
     print("Type 'exit' anytime to quit.\n")
 
     while current_index < num_words:
-        word_state = word_slots[current_index]
+        word_state = session.boards[current_index]
 
         # If there are previous guesses, apply feedback for them
         if guess_count > 0:
             print(f"\n📝 Enter feedback for all previous guesses on {word_state['label']}:")
-            for prev_guess in past_guesses:
-                if word_state["solved"]:
-                    break
+            for prev_guess in list(session.past_guesses):
                 feedback = input(f"Feedback for {prev_guess.upper()} on {word_state['label']}: ").strip().lower()
                 if feedback == 'exit':
                     return False
@@ -48,17 +45,11 @@ def play_sequence_solver(num_words, opener_guesses, full_word_list):
                     print("❌ Invalid feedback.")
                     return False
 
-                # Filter possible candidates based on feedback
-                word_state["candidate_words"] = filter_words_for_word(word_state["candidate_words"], prev_guess, feedback)
-
-                # Check if word is solved from feedback
-                if normalize_feedback(feedback) == WIN_FEEDBACK or len(word_state["candidate_words"]) == 1:
-                    solved_word = word_state["candidate_words"][0]
+                # Filter possible candidates and check if the word is solved from feedback
+                if session.record_feedback(current_index, prev_guess, feedback):
                     print(f"✅ {word_state['label']} solved early from previous feedback!")
-                    print(f"🟢 The word is: {solved_word.upper()}")
-                    if solved_word not in past_guesses:
-                        past_guesses.append(solved_word)
-                    word_state["solved"] = True
+                    print(f"🟢 The word is: {word_state['solution'].upper()}")
+                    session.record_guess(word_state["solution"])
                     guess_count += 1
                     break
 
@@ -69,24 +60,12 @@ def play_sequence_solver(num_words, opener_guesses, full_word_list):
 
         # Main guessing loop for current word
         while not word_state["solved"]:
-            # Count how many openers have been used for this word
-            local_guess_count = sum(1 for g in past_guesses if g in opener_guesses)
-
-            # Use opener guess if any left, else use scored word
-            use_openers = local_guess_count < len(opener_guesses)
-            if use_openers:
-                guess = opener_guesses[local_guess_count]
-            else:
-                # If only one candidate left, use it
-                if len(word_state["candidate_words"]) == 1:
-                    guess = word_state["candidate_words"][0]
-                else:
-                    guess = get_top_scored_words(word_state["candidate_words"], past_guesses)
-                    if not guess:
-                        print("⚠️ No guesses available.")
-                        return False
+            guess = session.next_guess(board=current_index)
+            if not guess:
+                print("⚠️ No guesses available.")
+                return False
 
-            past_guesses.append(guess)
+            session.record_guess(guess)
             print(f"\n🔍 Suggested guess #{guess_count + 1}: {guess.upper()}")
             guess_count += 1
 
@@ -98,17 +77,11 @@ def play_sequence_solver(num_words, opener_guesses, full_word_list):
                 print("❌ Invalid feedback.")
                 return False
 
-            # Filter candidates based on feedback
-            word_state["candidate_words"] = filter_words_for_word(word_state["candidate_words"], guess, feedback)
-
-            # Check if solved
-            if normalize_feedback(feedback) == WIN_FEEDBACK or len(word_state["candidate_words"]) == 1:
-                solved_word = word_state["candidate_words"][0] if len(word_state["candidate_words"]) == 1 else guess
-                print(f"🟢 The word is: {solved_word.upper()}")
+            # Filter candidates and check if solved
+            if session.record_feedback(current_index, guess, feedback):
+                print(f"🟢 The word is: {word_state['solution'].upper()}")
                 print(f"✅ {word_state['label']} has been solved!")
-                if solved_word not in past_guesses:
-                    past_guesses.append(solved_word)
-                word_state["solved"] = True
+                session.record_guess(word_state["solution"])
                 guess_count += 1
                 current_index += 1
                 break
@@ -0,0 +1,219 @@
+# registry.py
+"""
+Registry of word dictionaries keyed by name or path.
+Each dictionary is loaded lazily on first use, its indexes are built once and
+shared read-only with every caller, and it is reloaded when its files' content
+changes. Least recently used dictionaries are evicted to stay within a memory budget.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from wordle_solver.constants import WORD_LIST_PATH, ALLOWED_GUESSES_PATH, DICTIONARY_MEMORY_BUDGET
+from wordle_solver.loader import build_dictionary, load_word_lists
+
+DEFAULT_DICTIONARY = "default"
+
+
+def content_hash(paths):
+    """
+    Hashes the contents of one or more files.
+
+    Args:
+        paths (list[str]): Files to hash, in order.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def estimate_size(dictionary):
+    """
+    Estimates the memory held by a dictionary's word lists and indexes.
+
+    Args:
+        dictionary (Mapping): Dictionary from build_dictionary.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    size = 0
+    words = set(dictionary["answers"]) | set(dictionary["guesses"])
+    size += sum(sys.getsizeof(word) for word in words)
+    indexes = {id(dictionary["answer_index"]): dictionary["answer_index"], id(dictionary["guess_index"]): dictionary["guess_index"]}
+    for index in indexes.values():
+        size += sys.getsizeof(index["words"]) + sys.getsizeof(index["positions"])
+        size += sum(sys.getsizeof(mask) for masks in index["position"] for mask in masks.values())
+        size += sum(sys.getsizeof(mask) for masks in index["min_count"].values() for mask in masks)
+    return size
+
+
+def _freeze_index(index):
+    """Wraps an index and every table inside it in read-only views."""
+    frozen = dict(index)
+    frozen["words"] = tuple(index["words"])
+    frozen["positions"] = MappingProxyType(index["positions"])
+    frozen["position"] = tuple(MappingProxyType(masks) for masks in index["position"])
+    frozen["min_count"] = MappingProxyType({ch: tuple(masks) for ch, masks in index["min_count"].items()})
+    return MappingProxyType(frozen)
+
+
+def _freeze(dictionary):
+    """Wraps a dictionary and its indexes in read-only views."""
+    frozen = dict(dictionary)
+    frozen["answer_index"] = _freeze_index(dictionary["answer_index"])
+    frozen["guess_index"] = (
+        frozen["answer_index"] if dictionary["guess_index"] is dictionary["answer_index"]
+        else _freeze_index(dictionary["guess_index"])
+    )
+    return MappingProxyType(frozen)
+
+
+class DictionaryRegistry:
+    """
+    Lazily loads, caches and evicts dictionaries by name.
+    Safe to use from several threads; a dictionary is only loaded once even
+    when many callers ask for it at the same time.
+    """
+
+    def __init__(self, memory_budget=DICTIONARY_MEMORY_BUDGET):
+        """
+        Creates an empty registry.
+
+        Args:
+            memory_budget (int): Approximate bytes of loaded dictionaries to keep.
+        """
+        self.memory_budget = memory_budget
+        self._sources = {}  # name -> (answers_path, guesses_path)
+        self._loaded = OrderedDict()  # name -> cache entry, least recently used first
+        self._load_locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, answers_path, guesses_path=None):
+        """
+        Registers a dictionary under a name. Nothing is loaded until first use.
+
+        Args:
+            name (str): Dictionary name, e.g. "en-gb" or "event-2025".
+            answers_path (str): CSV of possible answers.
+            guesses_path (str | None): CSV of extra allowed guesses, or None.
+        """
+        with self._lock:
+            if self._sources.get(name) != (answers_path, guesses_path):
+                self._sources[name] = (answers_path, guesses_path)
+                self._loaded.pop(name, None)
+
+    def names(self):
+        """
+        Lists the registered dictionary names.
+
+        Returns:
+            list[str]: Registered names.
+        """
+        with self._lock:
+            return list(self._sources)
+
+    def get(self, name=DEFAULT_DICTIONARY):
+        """
+        Returns a dictionary, loading or reloading it if needed.
+
+        Args:
+            name (str): Registered name, or the path of an answers CSV.
+
+        Returns:
+            Mapping: Read-only dictionary with "answers", "guesses", their indexes and "content_hash".
+        """
+        with self._lock:
+            source = self._sources.get(name)
+            if source is None:
+                if not os.path.exists(name):
+                    raise KeyError(f"Unknown dictionary: {name!r}")
+                source = self._sources[name] = (name, None)
+            load_lock = self._load_locks.setdefault(name, threading.Lock())
+
+        paths = [path for path in source if path]
+        stamp = [(os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in paths]
+
+        with load_lock:
+            with self._lock:
+                entry = self._loaded.get(name)
+                if entry is not None:
+                    self._loaded.move_to_end(name)
+                    if entry["stamp"] == stamp:
+                        return entry["dictionary"]
+
+            # Files were touched (or never loaded): only reload if the content changed
+            digest = content_hash(paths)
+            if entry is not None and entry["dictionary"]["content_hash"] == digest:
+                entry["stamp"] = stamp
+                return entry["dictionary"]
+
+            dictionary = dict(build_dictionary(*(tuple(words) for words in load_word_lists(*source))))
+            dictionary["content_hash"] = digest
+            entry = {"dictionary": _freeze(dictionary), "stamp": stamp, "size": estimate_size(dictionary)}
+
+            with self._lock:
+                if self._sources.get(name) == source:
+                    self._loaded[name] = entry
+                    self._loaded.move_to_end(name)
+                    self._evict(keep=name)
+            return entry["dictionary"]
+
+    def invalidate(self, name=None):
+        """
+        Drops a cached dictionary (or all of them) so the next get reloads it.
+
+        Args:
+            name (str | None): Dictionary to drop, or None for all.
+        """
+        with self._lock:
+            if name is None:
+                self._loaded.clear()
+            else:
+                self._loaded.pop(name, None)
+
+    def loaded_size(self):
+        """
+        Returns the estimated memory held by loaded dictionaries.
+
+        Returns:
+            int: Approximate size in bytes.
+        """
+        with self._lock:
+            return sum(entry["size"] for entry in self._loaded.values())
+
+    def _evict(self, keep):
+        """Evicts least recently used dictionaries until within budget. Caller holds the lock."""
+        total = sum(entry["size"] for entry in self._loaded.values())
+        for name in list(self._loaded):
+            if total <= self.memory_budget:
+                break
+            if name != keep:
+                total -= self._loaded.pop(name)["size"]
+
+
+DEFAULT_REGISTRY = DictionaryRegistry()
+DEFAULT_REGISTRY.register(DEFAULT_DICTIONARY, WORD_LIST_PATH, ALLOWED_GUESSES_PATH)
+
+
+def get_dictionary(name=DEFAULT_DICTIONARY):
+    """
+    Returns a dictionary from the default registry.
+
+    Args:
+        name (str): Registered name, or the path of an answers CSV.
+
+    Returns:
+        Mapping: Read-only dictionary shared by every caller.
+    """
+    return DEFAULT_REGISTRY.get(name)
@@ -3,14 +3,27 @@
 Implements scoring logic for Wordle guesses.
 """
 
-from collections import Counter
+import threading
+import numpy as np
+from collections import Counter, OrderedDict
+from wordle_solver.constants import WORD_LENGTH, SCORING_STRATEGY
+from wordle_solver.indexing import encode_words
+from wordle_solver.transposition import fingerprint, state_key
 
-def score_words(words):
+GREEN_WEIGHT = 2  # Value of a letter landing in its exact position
+YELLOW_WEIGHT = 1  # Value of a letter only known to be present
+FEATURE_CACHE_SIZE = 8  # Guess lists whose one-hot matrices are kept between calls
+
+_feature_cache = OrderedDict()  # tuple of guesses -> read-only feature matrix, least recently used first
+_feature_lock = threading.Lock()
+
+def score_words(words, guesses=None):
     """
     Scores words based on letter frequency across all candidate words.
 
     Args:
         words (list[str]): List of candidate words.
+        guesses (list[str] | None): Words to score; defaults to the candidates themselves.
 
     Returns:
         list[tuple[str, int]]: Sorted list of (word, score) tuples in descending score order.
@@ -20,7 +33,7 @@ def score_words(words):
     freq = Counter("".join(words))
     scores = {}
 
-    for word in words:
+    for word in (words if guesses is None else guesses):
         # Score is the sum of frequencies of each unique letter in the word
         scores[word] = sum(freq[c] for c in set(word))
 
@@ -28,7 +41,96 @@ def score_words(words):
     return sorted(scores.items(), key=lambda x: x[1], reverse=True)
 
 
-def get_top_scored_words(word_list, past_guesses, top_n=1):
+def one_hot_features(words):
+    """
+    Encodes words as one-hot letter-by-position columns plus letter-presence columns.
+
+    Args:
+        words (list[str]): Lowercase words.
+
+    Returns:
+        np.ndarray: (N, WORD_LENGTH*26 + 26) uint8 matrix. Column pos*26 + letter is set when
+            the letter is at that position; column WORD_LENGTH*26 + letter is set when the
+            letter appears anywhere (once, however many times it repeats).
+    """
+    encoded = encode_words(words)
+    features = np.zeros((len(words), WORD_LENGTH * 26 + 26), dtype=np.uint8)
+    rows = np.arange(len(words))[:, None]
+    features[rows, np.arange(WORD_LENGTH) * 26 + encoded] = 1
+    features[rows, WORD_LENGTH * 26 + encoded] = 1
+    return features
+
+
+def _guess_features(guesses):
+    """
+    Returns the one-hot matrix of a guess list, reusing it across calls.
+    The allowed-guess list is the same on nearly every turn, so only the first
+    call pays for encoding it.
+
+    Args:
+        guesses (list[str]): Words to score.
+
+    Returns:
+        np.ndarray: Read-only matrix from one_hot_features.
+    """
+    key = tuple(guesses)
+    with _feature_lock:
+        features = _feature_cache.get(key)
+        if features is not None:
+            _feature_cache.move_to_end(key)
+            return features
+
+    features = one_hot_features(guesses)
+    features.flags.writeable = False
+    with _feature_lock:
+        _feature_cache[key] = features
+        while len(_feature_cache) > FEATURE_CACHE_SIZE:
+            _feature_cache.popitem(last=False)
+    return features
+
+
+def score_words_positional(words, guesses=None):
+    """
+    Scores words by how many candidates they would hit with green and yellow letters.
+    Per-position letter counts and per-letter presence counts come from one column sum
+    over the candidates' one-hot matrix; every guess is then scored with one
+    matrix-vector product against the guess list's cached matrix. A guess letter earns GREEN_WEIGHT for each candidate with
+    that letter in that position, and YELLOW_WEIGHT for each other candidate containing
+    it, counted once per distinct letter so duplicates are not double-counted.
+
+    Args:
+        words (list[str]): List of candidate words.
+        guesses (list[str] | None): Words to score; defaults to the candidates themselves.
+
+    Returns:
+        list[tuple[str, int]]: Sorted list of (word, score) tuples in descending score order.
+    """
+    guesses = list(dict.fromkeys(words if guesses is None else guesses))
+    if not words or not guesses:
+        return [(word, 0) for word in guesses]
+
+    counts = one_hot_features(words).sum(axis=0, dtype=np.int64)
+    split = WORD_LENGTH * 26
+
+    # green*pos + yellow*(present - pos) == (green - yellow)*pos + yellow*present
+    weights = np.concatenate((
+        (GREEN_WEIGHT - YELLOW_WEIGHT) * counts[:split],
+        YELLOW_WEIGHT * counts[split:],
+    ))
+    scores = _guess_features(guesses) @ weights
+
+    order = np.argsort(-scores, kind="stable")
+    return [(guesses[i], int(scores[i])) for i in order]
+
+
+SCORERS = {
+    "frequency": score_words,
+    "positional": score_words_positional,
+}
+
+
+def get_top_scored_words(word_list, past_guesses, top_n=1, guesses=None, table=None, candidate_sets=None,
+                         strategy=SCORING_STRATEGY, scorer=None):
     """
     Returns the highest scoring word(s), excluding any that have already been guessed.
 
@@ -36,17 +138,36 @@ def get_top_scored_words(word_list, past_guesses, top_n=1):
         word_list (list[str]): List of candidate words.
         past_guesses (list[str]): Words that have already been guessed.
         top_n (int): Number of top-scoring words to return.
+        guesses (list[str] | None): Words to rank; defaults to the candidates themselves.
+        table (TranspositionTable | None): Cache checked before scoring a single best word.
+        candidate_sets (list[list[str]] | None): Per-board candidate lists word_list was pooled from,
+            used to key the table; defaults to [word_list].
+        strategy (str): Name of the scorer in SCORERS.
+        scorer (Callable | None): Implementation to score with instead of SCORERS[strategy], such as a
+            compiled kernel; it must rank exactly like the strategy it stands in for.
 
     Returns:
         list[str] or str: Top N scored words as a list, or single string if top_n == 1.
     """
-        
+
+    # Check the transposition table for a previously chosen word
+    key = None
+    if table is not None and top_n == 1:
+        ranked = word_list if guesses is None else guesses
+        key = state_key(fingerprint(ranked), strategy, candidate_sets or [word_list], past_guesses)
+        hit = table.get(key)
+        if hit is not None:
+            return hit[0]
+
     # Filter out previously guessed words and score the rest
     scored = [
         (word, score)
-        for word, score in score_words(word_list)
+        for word, score in (scorer or SCORERS[strategy])(word_list, guesses)
         if word not in past_guesses
     ]
 
+    if key is not None and scored:
+        table.put(key, *scored[0])
+
     # Return top_n results as list or single word
-    return scored[:top_n] if top_n > 1 else (scored[0][0] if scored else None)
\ No newline at end of file
+    return scored[:top_n] if top_n > 1 else (scored[0][0] if scored else None)
@@ -0,0 +1,217 @@
+# snapshot.py
+"""
+Compact binary snapshots of in-progress games.
+A snapshot holds a Session's guesses, opener position and per-board
+candidate (and hard-mode legal) bitsets, so a server can drop idle games from memory and restore them
+later without replaying feedback.
+
+Layout (little endian):
+    header      magic "WSNP", version u8, flags u8, boards u16, past guesses u16,
+                opener index u16, pending u16, dictionary hash length u8, dictionary hash
+    words       past guesses, pending solutions
+    per board   flags u8, [solution word], candidate mask, [legal mask]
+
+A word is its index into the guess list (u16, or u32 for lists of 65535 words
+or more); words outside the list are the sentinel index followed by the
+letters. A mask is stored as "full", as a list of set bit indexes, or as raw
+bytes, whichever is shortest.
+"""
+
+import struct
+from wordle_solver.constants import WORD_LENGTH
+from wordle_solver.indexing import words_from_mask
+
+MAGIC = b"WSNP"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHHHHB")
+
+# Header flags
+HARD_MODE = 1
+WIDE_INDEXES = 2
+
+# Board flags
+SOLVED = 1
+GUESSED = 2
+
+# Mask encodings
+MASK_FULL = 0
+MASK_SPARSE = 1
+MASK_RAW = 2
+
+
+def session_to_bytes(session):
+    """
+    Serializes a game.
+
+    Args:
+        session (Session): Game to snapshot; not modified.
+
+    Returns:
+        bytes: Snapshot that session_from_bytes can restore.
+    """
+    solver = session.solver
+    dictionary = solver.dictionary
+    guesses = dictionary["guesses"]
+    wide = len(guesses) >= 0xFFFF
+    index_format = "<I" if wide else "<H"
+    sentinel = 0xFFFFFFFF if wide else 0xFFFF
+    positions = dictionary["guess_index"]["positions"]
+
+    flags = (HARD_MODE if solver.hard_mode else 0) | (WIDE_INDEXES if wide else 0)
+    digest = solver.dictionary_hash.encode("ascii")
+    parts = [HEADER.pack(
+        MAGIC, VERSION, flags,
+        len(session.boards), len(session.past_guesses), session.opener_index, len(session.pending), len(digest)
+    ), digest]
+
+    def pack_word(word):
+        i = positions.get(word)
+        if i is None:
+            parts.append(struct.pack(index_format, sentinel) + word.encode("ascii"))
+        else:
+            parts.append(struct.pack(index_format, i))
+
+    for words in (session.past_guesses, session.pending):
+        for word in words:
+            pack_word(word)
+
+    answer_index = dictionary["answer_index"]
+    for board in session.boards:
+        board_flags = (SOLVED if board["solved"] else 0) | (GUESSED if board["guessed"] else 0)
+        parts.append(bytes((board_flags,)))
+        if board["solved"]:
+            pack_word(board["solution"])
+        parts.append(_pack_mask(board["candidate_mask"], answer_index["all_mask"], len(answer_index["words"]), index_format))
+        if solver.hard_mode:
+            guess_index = dictionary["guess_index"]
+            parts.append(_pack_mask(board["legal_mask"], guess_index["all_mask"], len(guesses), index_format))
+    return b"".join(parts)
+
+
+def session_from_bytes(solver, data):
+    """
+    Restores a game saved by session_to_bytes.
+
+    Args:
+        solver (Solver): Solver to attach the game to; must use the same dictionary and hard-mode setting.
+        data (bytes): Snapshot.
+
+    Returns:
+        Session: The restored game.
+
+    Raises:
+        ValueError: If the snapshot is malformed or was taken with a different dictionary or rules.
+    """
+    try:
+        magic, version, flags, num_boards, num_past, opener_index, num_pending, digest_size = HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Snapshot is truncated.") from None
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a game snapshot, or an unsupported version.")
+    offset = HEADER.size + digest_size
+    if data[HEADER.size:offset] != solver.dictionary_hash.encode("ascii"):
+        raise ValueError("Snapshot was taken with a different dictionary.")
+    if bool(flags & HARD_MODE) != solver.hard_mode:
+        raise ValueError("Snapshot was taken with a different hard-mode setting.")
+    if opener_index > len(solver.openers):
+        raise ValueError("Snapshot was taken with more openers than the solver has.")
+
+    dictionary = solver.dictionary
+    guesses = dictionary["guesses"]
+    index_format = "<I" if flags & WIDE_INDEXES else "<H"
+    index_size = struct.calcsize(index_format)
+    sentinel = 0xFFFFFFFF if flags & WIDE_INDEXES else 0xFFFF
+
+    def read_word():
+        nonlocal offset
+        (i,) = struct.unpack_from(index_format, data, offset)
+        offset += index_size
+        if i != sentinel:
+            return guesses[i]
+        word = data[offset:offset + WORD_LENGTH].decode("ascii")
+        offset += WORD_LENGTH
+        return word
+
+    def read_mask(index):
+        nonlocal offset
+        mask, indexes, offset = _unpack_mask(data, offset, index["all_mask"], len(index["words"]), index_format, index_size)
+        return mask, indexes
+
+    session = solver.new_session(0)
+    try:
+        session.past_guesses = [read_word() for _ in range(num_past)]
+        session.opener_index = opener_index
+        session.pending = [read_word() for _ in range(num_pending)]
+
+        answer_index = dictionary["answer_index"]
+        for i in range(num_boards):
+            board_flags = data[offset]
+            offset += 1
+            solution = read_word() if board_flags & SOLVED else None
+            mask, indexes = read_mask(answer_index)
+            if mask == answer_index["all_mask"]:
+                candidate_words = list(dictionary["answers"])
+            elif indexes is not None:
+                candidate_words = [answer_index["words"][j] for j in indexes]
+            else:
+                candidate_words = words_from_mask(answer_index, mask)
+            board = {
+                "label": f"Word {i+1}",
+                "candidate_mask": mask,
+                "candidate_words": candidate_words,
+                "solved": bool(board_flags & SOLVED),
+                "solution": solution,
+                "guessed": bool(board_flags & GUESSED),
+            }
+            if solver.hard_mode:
+                board["legal_mask"] = read_mask(dictionary["guess_index"])[0]
+            session.boards.append(board)
+    except (IndexError, struct.error, UnicodeDecodeError):
+        raise ValueError("Snapshot is truncated or corrupt.") from None
+    if offset != len(data):
+        raise ValueError("Snapshot has trailing data.")
+    return session
+
+
+def _pack_mask(mask, all_mask, size, index_format):
+    """Encodes a bitmask in whichever of the full / sparse / raw forms is shortest."""
+    if mask == all_mask:
+        return bytes((MASK_FULL,))
+    raw_size = (size + 7) // 8
+    count = mask.bit_count()
+    if (count + 1) * struct.calcsize(index_format) < raw_size:
+        indexes = []
+        rest = mask
+        while rest:
+            low = rest & -rest  # Lowest set bit
+            indexes.append(low.bit_length() - 1)
+            rest ^= low
+        return bytes((MASK_SPARSE,)) + struct.pack(f"<{count + 1}{index_format[1]}", count, *indexes)
+    return bytes((MASK_RAW,)) + mask.to_bytes(raw_size, "little")
+
+
+def _unpack_mask(data, offset, all_mask, size, index_format, index_size):
+    """Decodes a mask written by _pack_mask; returns (mask, set bit indexes or None, new offset)."""
+    kind = data[offset]
+    offset += 1
+    if kind == MASK_FULL:
+        return all_mask, None, offset
+    if kind == MASK_SPARSE:
+        (count,) = struct.unpack_from(index_format, data, offset)
+        offset += index_size
+        indexes = struct.unpack_from(f"<{count}{index_format[1]}", data, offset)
+        mask = 0
+        for i in indexes:
+            mask |= 1 << i
+        if mask & ~all_mask:
+            raise ValueError("Snapshot mask has bits outside the word list.")
+        return mask, indexes, offset + count * index_size
+    if kind == MASK_RAW:
+        raw_size = (size + 7) // 8
+        if offset + raw_size > len(data):
+            raise IndexError("mask runs past the end of the snapshot")
+        mask = int.from_bytes(data[offset:offset + raw_size], "little")
+        if mask & ~all_mask:
+            raise ValueError("Snapshot mask has bits outside the word list.")
+        return mask, None, offset + raw_size
+    raise ValueError(f"Unknown mask encoding: {kind}")
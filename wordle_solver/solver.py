@@ -0,0 +1,398 @@
+# solver.py
+"""
+Re-entrant solver core.
+A Solver holds the immutable inputs shared by every game (dictionary,
+openers, rules, scoring strategy, transposition table); a Session holds the
+state of one game. Sessions never modify the solver or the caller's data, so
+many games can run in parallel threads while sharing one loaded dictionary.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from wordle_solver.constants import WIN_FEEDBACK, SCORING_STRATEGY, ENDGAME_THRESHOLD, ENDGAME_TIME_BUDGET
+from wordle_solver.endgame import EndgameSolver
+from wordle_solver.filtering import filter_mask_for_word, filter_word_slot
+from wordle_solver.helpers import normalize_feedback, simulate_feedback
+from wordle_solver.indexing import mask_contains, words_from_mask
+from wordle_solver.kernels import COMPILED_SCORERS
+from wordle_solver.loader import as_dictionary, dictionary_hash
+from wordle_solver.scoring import SCORERS, get_top_scored_words
+from wordle_solver.snapshot import session_from_bytes, session_to_bytes
+
+FEW_LEFT = 3  # Boards this small are scored on their own when the endgame search gives no guess
+
+
+@dataclass(frozen=True)
+class Solver:
+    """
+    Immutable solver configuration shared by any number of sessions.
+
+    Attributes:
+        dictionary (Mapping): Dictionary from load_dictionary or the registry (a plain word list is converted).
+        openers (tuple[str]): Starting guesses, copied from the caller's sequence.
+        hard_mode (bool): If True, every guess must satisfy all hints revealed so far.
+        strategy (str): Name of the scoring strategy (see scoring.SCORERS).
+        table (TranspositionTable | None): Shared cache of next-guess results.
+        endgame_threshold (int): Boards with this many candidates or fewer get an exact endgame search (0 disables it).
+        endgame_budget (float | None): Seconds an endgame search may take before falling back to the
+            heuristic, or None for no time limit.
+        endgame_node_limit (int | None): Candidate sets an endgame search may expand before falling back;
+            unlike the time budget, gives the same guesses on every run and machine.
+    """
+    dictionary: object
+    openers: tuple = ()
+    hard_mode: bool = False
+    strategy: str = SCORING_STRATEGY
+    table: object = None
+    endgame_threshold: int = ENDGAME_THRESHOLD
+    endgame_budget: float = ENDGAME_TIME_BUDGET
+    endgame_node_limit: int = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "dictionary", as_dictionary(self.dictionary))
+        object.__setattr__(self, "openers", tuple(self.openers))
+
+    @cached_property
+    def dictionary_hash(self):
+        """str: Hash identifying the dictionary in snapshots (see loader.dictionary_hash)."""
+        return dictionary_hash(self.dictionary)
+
+    @cached_property
+    def scorer(self):
+        """Callable: Scorer for the strategy, using the compiled kernel when there is one."""
+        return COMPILED_SCORERS.get(self.strategy, SCORERS[self.strategy])
+
+    @cached_property
+    def endgame(self):
+        """EndgameSolver: Exact endgame search, with its memo shared by every session."""
+        return EndgameSolver(self.dictionary, self.hard_mode)
+
+    def new_session(self, num_boards=1):
+        """
+        Starts a new game.
+
+        Args:
+            num_boards (int): Number of words to solve at once.
+
+        Returns:
+            Session: Fresh game state.
+        """
+        return Session(self, num_boards)
+
+
+class Session:
+    """
+    State of one game: per-board candidates (and legal guesses in hard mode),
+    the guesses made so far, and solutions that are known but not yet guessed.
+    A session is not meant to be shared between threads; give each game its own.
+    """
+
+    def __init__(self, solver, num_boards=1):
+        """
+        Creates the state for a new game.
+
+        Args:
+            solver (Solver): Shared configuration.
+            num_boards (int): Number of words to solve at once.
+        """
+        self.solver = solver
+        dictionary = solver.dictionary
+        self.boards = [
+            {
+                "label": f"Word {i+1}",
+                "candidate_mask": dictionary["answer_index"]["all_mask"],
+                "candidate_words": list(dictionary["answers"]),
+                "solved": False,     # Solution is known
+                "solution": None,
+                "guessed": False,    # Solution has been guessed
+            }
+            for i in range(num_boards)
+        ]
+        if solver.hard_mode:
+            for board in self.boards:
+                board["legal_mask"] = dictionary["guess_index"]["all_mask"]
+        self.past_guesses = []
+        self.pending = []  # Known solutions that still have to be guessed
+        self.opener_index = 0  # Next opener to consider; earlier ones were played or skipped
+
+    @property
+    def guess_count(self):
+        """int: Number of guesses made so far."""
+        return len(self.past_guesses)
+
+    def unsolved(self):
+        """
+        Lists the boards whose solution is not known yet.
+
+        Returns:
+            list[int]: Board indexes.
+        """
+        return [i for i, board in enumerate(self.boards) if not board["solved"]]
+
+    def all_solved(self):
+        """Returns True once every board's solution is known."""
+        return all(board["solved"] for board in self.boards)
+
+    def is_complete(self):
+        """Returns True once every board's solution has been guessed."""
+        return all(board["guessed"] for board in self.boards)
+
+    def copy(self):
+        """
+        Copies the game so the copy can be played on without affecting this one.
+        Word lists are shared, since the session only ever replaces them.
+
+        Returns:
+            Session: Independent game state with the same solver.
+        """
+        clone = Session(self.solver, 0)
+        clone.boards = [dict(board) for board in self.boards]
+        clone.past_guesses = list(self.past_guesses)
+        clone.pending = list(self.pending)
+        clone.opener_index = self.opener_index
+        return clone
+
+    def to_bytes(self):
+        """
+        Serializes the game into a compact snapshot (see snapshot.py).
+
+        Returns:
+            bytes: Snapshot for Session.from_bytes.
+        """
+        return session_to_bytes(self)
+
+    @staticmethod
+    def from_bytes(solver, data):
+        """
+        Restores a game from a snapshot without replaying its feedback.
+
+        Args:
+            solver (Solver): Solver with the same dictionary and hard-mode setting as the saved game.
+            data (bytes): Snapshot from Session.to_bytes.
+
+        Returns:
+            Session: The restored game.
+        """
+        return session_from_bytes(solver, data)
+
+    def record_guess(self, guess):
+        """
+        Records a guess. Guessing a known solution completes its board.
+        In hard mode, boards whose solution is known but not yet guessed still reveal
+        hints, so their legal guesses are narrowed with the feedback the solution gives.
+
+        Args:
+            guess (str): The guessed word.
+        """
+        if guess not in self.past_guesses:
+            self.past_guesses.append(guess)
+        openers = self.solver.openers
+        if self.opener_index < len(openers) and openers[self.opener_index] == guess:
+            self.opener_index += 1
+        if guess in self.pending:
+            self.pending.remove(guess)
+        guess_index = self.solver.dictionary["guess_index"]
+        for board in self.boards:
+            if board["solution"] == guess:
+                board["guessed"] = True
+            elif self.solver.hard_mode and board["solved"] and not board["guessed"]:
+                board["legal_mask"] = filter_mask_for_word(
+                    guess_index, board["legal_mask"], guess, simulate_feedback(board["solution"], guess)
+                )
+
+    def record_feedback(self, board, guess, feedback):
+        """
+        Narrows one board using the feedback it gave for a guess.
+
+        Args:
+            board (int): Board index.
+            guess (str): The guessed word.
+            feedback (str): Feedback string for the guess.
+
+        Returns:
+            bool: True if the board's solution is now known.
+        """
+        state = self.boards[board]
+        if state["solved"]:
+            return True
+
+        if normalize_feedback(feedback) == WIN_FEEDBACK:
+            self._solve(state, guess)
+            state["guessed"] = True
+            return True
+
+        filter_word_slot(state, self.solver.dictionary, guess, feedback)
+        if len(state["candidate_words"]) == 1:
+            self._solve(state, state["candidate_words"][0])
+        return state["solved"]
+
+    def next_guess(self, board=None):
+        """
+        Picks the next guess: the next opener, then known solutions, then the
+        endgame search or the scorer. Openers that are already guessed or break a
+        hard-mode hint when their turn comes are skipped for good.
+
+        Args:
+            board (int | None): Board to focus on (sequential play), or None to pick
+                for all boards at once.
+
+        Returns:
+            str | None: Suggested guess, or None if nothing can be guessed.
+        """
+        if board is not None:
+            return self._next_guess_for_board(self.boards[board])
+
+        solver = self.solver
+        guess_index = solver.dictionary["guess_index"]
+        unsolved = [self.boards[i] for i in self.unsolved()]
+        if not unsolved:
+            return self.pending[0] if self.pending else None
+
+        # Every board still in play constrains hard-mode guesses, solved or not
+        in_play = [board for board in self.boards if not board["guessed"]]
+        legal_mask = _legal_guess_mask(in_play, guess_index) if solver.hard_mode else None
+
+        def is_legal(word):
+            return legal_mask is None or mask_contains(guess_index, legal_mask, word)
+
+        # Play the openers, then any solutions already found
+        opener = self._next_opener(is_legal)
+        if opener:
+            return opener
+        for solution in self.pending:
+            if is_legal(solution):
+                return solution
+
+        # Target the board closest to being solved: exactly if it is small enough, else by score
+        target = min(unsolved, key=lambda board: len(board["candidate_words"]))
+        guess = self._endgame_guess(target, is_legal if solver.hard_mode else None)
+        if not guess and (len(target["candidate_words"]) <= FEW_LEFT or len(unsolved) == 1):
+            guess = _top_legal_guess(target["candidate_words"], self.past_guesses, is_legal, solver)
+
+        if not guess:
+            # Rank allowed guesses by letter frequency across all remaining candidates
+            pooled = [word for board in unsolved for word in board["candidate_words"]]
+            guesses = solver.dictionary["guesses"] if legal_mask is None else words_from_mask(guess_index, legal_mask)
+            guess = get_top_scored_words(
+                pooled, self.past_guesses, guesses=guesses, table=solver.table,
+                candidate_sets=[board["candidate_words"] for board in unsolved], strategy=solver.strategy,
+                scorer=solver.scorer
+            )
+        return guess
+
+    def _next_guess_for_board(self, state):
+        """Picks the next guess for a single board, as sequential play does."""
+        solver = self.solver
+        if state["solved"]:
+            return state["solution"]
+
+        guess_index = solver.dictionary["guess_index"]
+        is_legal = (lambda word: mask_contains(guess_index, state["legal_mask"], word)) if solver.hard_mode else None
+        opener = self._next_opener(is_legal)
+        if opener:
+            return opener
+
+        if len(state["candidate_words"]) == 1:
+            return state["candidate_words"][0]
+
+        guess = self._endgame_guess(state, is_legal)
+        if guess:
+            return guess
+        return get_top_scored_words(
+            state["candidate_words"], self.past_guesses, table=solver.table, strategy=solver.strategy,
+            scorer=solver.scorer
+        )
+
+    def _next_opener(self, is_legal=None):
+        """
+        Returns the next opener to play, moving past any that are already guessed or illegal.
+
+        Args:
+            is_legal (Callable[[str], bool] | None): Hard-mode legality check.
+
+        Returns:
+            str | None: Opener, or None once they are used up.
+        """
+        openers = self.solver.openers
+        while self.opener_index < len(openers):
+            opener = openers[self.opener_index]
+            if opener not in self.past_guesses and (is_legal is None or is_legal(opener)):
+                return opener
+            self.opener_index += 1
+        return None
+
+    def _endgame_guess(self, state, is_legal=None):
+        """
+        Runs the exact endgame search on a board if it is small enough.
+
+        Args:
+            state (dict): Board to solve.
+            is_legal (Callable[[str], bool] | None): Hard-mode legality check.
+
+        Returns:
+            str | None: Best guess, or None if the board is too large, no guess is legal,
+                or the search ran out of time.
+        """
+        solver = self.solver
+        if len(state["candidate_words"]) > solver.endgame_threshold:
+            return None
+        result = solver.endgame.best_guess(
+            state["candidate_mask"], is_legal, solver.endgame_budget, solver.endgame_node_limit
+        )
+        if result is None or (is_legal is not None and not is_legal(result[0])):
+            return None
+        return result[0]
+
+    def _solve(self, state, solution):
+        """Marks a board's solution as known and plans to guess it if it has not been guessed."""
+        state["solved"] = True
+        state["solution"] = solution
+        if solution in self.past_guesses:
+            state["guessed"] = True
+            return
+        if solution not in self.pending:
+            self.pending.append(solution)
+
+
+def _legal_guess_mask(boards, guess_index):
+    """
+    Combines the hard-mode legal guesses of the words still in play.
+    A guess must satisfy the hints of every word; if no guess does,
+    this relaxes to guesses that satisfy the hints of at least one word.
+
+    Args:
+        boards (list[dict]): Boards not yet guessed, holding "legal_mask".
+        guess_index (dict): Index over the allowed-guess list.
+
+    Returns:
+        int: Bitmask of legal guesses.
+    """
+    legal_mask = guess_index["all_mask"]
+    for board in boards:
+        legal_mask &= board["legal_mask"]
+    if not legal_mask:
+        for board in boards:
+            legal_mask |= board["legal_mask"]
+    return legal_mask
+
+
+def _top_legal_guess(candidate_words, past_guesses, is_legal, solver):
+    """
+    Scores a word's candidates and returns the best one that is a legal guess.
+
+    Args:
+        candidate_words (list[str]): Remaining candidates for one word.
+        past_guesses (list[str]): Words that have already been guessed.
+        is_legal (Callable[[str], bool]): Hard-mode legality check.
+        solver (Solver): Supplies the table and scoring strategy.
+
+    Returns:
+        str | None: Best legal guess, or None if no candidate is legal.
+    """
+    legal = [word for word in candidate_words if is_legal(word)]
+    if not legal:
+        return None
+    return get_top_scored_words(
+        candidate_words, past_guesses, guesses=legal, table=solver.table, strategy=solver.strategy,
+        scorer=solver.scorer
+    )
@@ -3,143 +3,632 @@
 Test mode for benchmarking the solver's performance on all words.
 """
 
-from wordle_solver.constants import WORD_LENGTH, WIN_FEEDBACK
-from wordle_solver.filtering import filter_words_for_word
-from wordle_solver.helpers import normalize_feedback, score_words
-import matplotlib.pyplot as plt
+from wordle_solver.constants import (
+    WORD_LENGTH, WIN_FEEDBACK, MAX_GUESSES, RESULTS_DIR, SCORING_STRATEGY, ENDGAME_NODE_LIMIT
+)
+from wordle_solver.helpers import normalize_feedback, simulate_feedback
+from wordle_solver.indexing import mask_contains
+from wordle_solver.kernels import NUMBA_AVAILABLE, encode_words, feedback_for_solutions, feedback_matrix, filter_words, score_words
+from wordle_solver.loader import as_dictionary, dictionary_hash
+from wordle_solver.solver import Solver
+from matplotlib.figure import Figure
+from statistics import NormalDist
+from string import ascii_lowercase
 import seaborn as sns
 import numpy as np
-from collections import defaultdict
+import csv
+import io
+import json
+import os
+import random
 
-def simulate_feedback(solution, guess):
+RESULT_COLUMNS = ["solution", "solved", "guesses", "guess_path", "candidate_counts"]
+CHECKPOINT_EVERY = 100  # Results rows between fsync checkpoints
+DEFAULT_SAMPLE_SIZE = 200  # Solutions drawn per batch in sampled estimates
+BACKEND_CHECK_CHUNK = 256  # Answers per feedback-matrix block in compare_backends
+
+def _benchmark_solver(dictionary, openers, hard_mode, strategy, table=None):
+    """
+    Builds the solver the benchmarks play with: the shipped solver, except that the endgame
+    search is bounded by ENDGAME_NODE_LIMIT instead of wall-clock time, so results do not
+    depend on machine load or on the order in which words are played.
+    """
+    return Solver(
+        dictionary, openers, hard_mode=hard_mode, strategy=strategy, table=table,
+        endgame_budget=None, endgame_node_limit=ENDGAME_NODE_LIMIT
+    )
+
+
+def play_solution(solution, solver, max_guesses=MAX_GUESSES):
     """
-    Generates feedback string for a guess against the actual solution.
+    Plays one simulated game against a known solution with the solver's own policy.
 
     Args:
-        solution (str): The correct word.
-        guess (str): The guessed word.
+        solution (str): The word to find.
+        solver (Solver): Solver configuration (dictionary, openers, hard mode, strategy, table, endgame);
+            give it an endgame node limit rather than a time budget for reproducible results.
+        max_guesses (int): Guesses allowed before the game is lost.
 
     Returns:
-        str: Feedback string in 'g', 'y', 'b' format.
+        dict: Outcome with "solution", "solved", "guesses" (int | None),
+            "guess_path" (list[str]) and "candidate_counts" (candidates left after each guess).
     """
+    session = solver.new_session()
+    candidate_counts = []
+
+    while session.guess_count < max_guesses:
+        guess = session.next_guess()
+        if not guess:
+            break  # No valid guesses left
 
-    feedback = ['b'] * WORD_LENGTH  # Start with all gray
-    solution_chars = list(solution)
-    guess_chars = list(guess)
-    used = [False] * WORD_LENGTH  # Track used positions for yellow logic
+        session.record_guess(guess)
+        feedback = simulate_feedback(solution, guess)
 
-    # First pass: green (correct letter and position)
-    for i in range(WORD_LENGTH):
-        if guess_chars[i] == solution_chars[i]:
-            feedback[i] = 'g'
-            used[i] = True
-            solution_chars[i] = None  # Mark solution letter as used
+        # Check if the word is solved
+        if normalize_feedback(feedback) == WIN_FEEDBACK:
+            candidate_counts.append(1)
+            return {
+                "solution": solution,
+                "solved": True,
+                "guesses": session.guess_count,
+                "guess_path": session.past_guesses,
+                "candidate_counts": candidate_counts,
+            }
 
-    # Second pass: yellow (correct letter, wrong position)
-    for i in range(WORD_LENGTH):
-        if feedback[i] == 'b' and guess_chars[i] in solution_chars:
-            idx = solution_chars.index(guess_chars[i])
-            if not used[idx]:
-                feedback[i] = 'y'
-                solution_chars[idx] = None  # Mark letter as used
+        # Filter remaining candidates based on feedback
+        session.record_feedback(0, guess, feedback)
+        candidate_counts.append(len(session.boards[0]["candidate_words"]))
 
-    return ''.join(feedback)
+    return {
+        "solution": solution,
+        "solved": False,
+        "guesses": None,
+        "guess_path": session.past_guesses,
+        "candidate_counts": candidate_counts,
+    }
 
-def test_solver_on_all_words(openers, full_words_list):
+
+def test_solver_on_all_words(openers, dictionary, hard_mode=False, results_path=None, resume=True, table=None,
+                             strategy=SCORING_STRATEGY):
     """
     Tests the solver's success rate using a given opener set across all words.
+    Each outcome is streamed to a CSV file as the run goes, so an interrupted run
+    resumes where it stopped. Summary statistics and the position heatmap are
+    then computed from that file and written next to it.
 
     Args:
         openers (list[str]): List of initial guesses to use before switching to scoring.
-        full_words_list (list[str]): Full dictionary of target words.
-    """
+        dictionary (dict | list[str]): Dictionary from load_dictionary, or a plain list of target words.
+        hard_mode (bool): If True, openers that break a revealed hint are skipped.
+        results_path (str | None): CSV file for per-word results; defaults to one named after
+            the openers inside RESULTS_DIR.
+        resume (bool): If True, skip words already recorded in an existing results file.
+        table (TranspositionTable | None): Shared cache of next-guess results.
+        strategy (str): Name of the scorer in SCORERS.
 
-    successes = 0  # Number of words solved
-    max_guesses_allowed = 6  # Max guesses per word (like Wordle rules)
-    total_words = len(full_words_list)
-    guess_counts = []  # Track number of guesses per word
-    solved_words = []
+    Returns:
+        dict: Summary statistics as returned by summarize_results.
+    """
 
-    for solution in full_words_list:
-        candidate_words = full_words_list.copy()  # Reset candidates each round
-        solved = False
-        past_guesses = []
-        guess_count = 0
+    solver = _benchmark_solver(dictionary, openers, hard_mode, strategy, table)
+    dictionary = solver.dictionary
+    full_words_list = dictionary["answers"]
+    if results_path is None:
+        tag = "-".join(openers) + ("-hard" if hard_mode else "")
+        if strategy != SCORING_STRATEGY:
+            tag += f"-{strategy}"
+        results_path = os.path.join(RESULTS_DIR, f"{tag}.csv")
 
-        while guess_count < max_guesses_allowed:
-            # Use opener guesses first
-            if guess_count < len(openers):
-                guess = openers[guess_count]
-            else:
-                # If only one candidate remains, use it
-                if len(candidate_words) == 1:
-                    guess = candidate_words[0]
-                else:
-                    # Score remaining words and choose the best one
-                    scored = [
-                        (word, score)
-                        for word, score in score_words(candidate_words)
-                        if word not in past_guesses
-                    ]
-                    if not scored:
-                        break  # No valid guesses left
-                    guess = scored[0][0]
-
-            past_guesses.append(guess)
-            feedback = simulate_feedback(solution, guess)
-
-            # Check if the word is solved
-            if normalize_feedback(feedback) == WIN_FEEDBACK:
-                successes += 1
-                guess_counts.append(guess_count + 1)
-                solved_words.append(solution)
-                solved = True
-                break
-            else:
-                # Filter remaining candidates based on feedback
-                candidate_words = filter_words_for_word(candidate_words, guess, feedback)
-                guess_count += 1
+    run_info = {
+        "openers": list(openers),
+        "hard_mode": hard_mode,
+        "strategy": strategy,
+        "dictionary_hash": dictionary_hash(dictionary),
+        "endgame_threshold": solver.endgame_threshold,
+        "endgame_node_limit": solver.endgame_node_limit,
+    }
+    done = _open_results(results_path, run_info, resume)
+    remaining = [solution for solution in full_words_list if solution not in done]
+    if done:
+        print(f"⏩ Resuming: {len(done)} words already recorded in {results_path}.")
 
-        if not solved:
-            guess_counts.append(None)  # Word was not solved
+    with open(results_path, "a", newline="") as f:
+        writer = csv.writer(f)
+        for n, solution in enumerate(remaining, 1):
+            outcome = play_solution(solution, solver)
+            writer.writerow([
+                outcome["solution"],
+                int(outcome["solved"]),
+                outcome["guesses"] or "",
+                " ".join(outcome["guess_path"]),
+                " ".join(str(c) for c in outcome["candidate_counts"]),
+            ])
+            f.flush()
+            if n % CHECKPOINT_EVERY == 0:
+                os.fsync(f.fileno())  # Checkpoint to disk
 
     # Print test results
-    print(f"\n📊 Test Summary for Openers: {openers}")
-    print(f"✅ Solved: {successes}/{total_words}")
-    if guess_counts:
-        solved_counts = [g for g in guess_counts if g is not None]
-        print(f"Avg Guesses for Solved: {sum(solved_counts) / len(solved_counts):.2f}")
-    generate_position_heatmap(solved_words)
+    summary = summarize_results(results_path)
+    print(f"\n📊 Test Summary for Openers: {openers}{' (hard mode)' if hard_mode else ''}")
+    print(f"✅ Solved: {summary['solved']}/{summary['total']}")
+    if summary["solved"]:
+        print(f"Avg Guesses for Solved: {summary['avg_guesses']:.2f}")
+    print(f"📁 Results written to {results_path} (summary: {summary['summary_path']}, heatmap: {summary['heatmap_path']})")
+    return summary
+
+
+def _open_results(results_path, run_info, resume):
+    """
+    Prepares a results CSV for appending and returns the words it already holds.
+    A partially written last row is dropped, and a file recorded for a different
+    configuration is started over.
+
+    Args:
+        results_path (str): CSV file for per-word results.
+        run_info (dict): Configuration of the run, stored in a sidecar JSON file.
+        resume (bool): If False, any existing results are discarded.
+
+    Returns:
+        set[str]: Solutions already recorded.
+    """
+    info_path = results_path + ".json"
+    directory = os.path.dirname(results_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
 
-def generate_position_heatmap(solved_words):
+    done = set()
+    if resume and os.path.exists(results_path) and os.path.exists(info_path):
+        with open(info_path) as f:
+            same_run = json.load(f) == run_info
+        if not same_run:
+            print("⚠️ Existing results were recorded with a different configuration; starting over.")
+        else:
+            with open(results_path, "rb") as f:
+                data = f.read()
+            complete = data[:data.rfind(b"\n") + 1]  # Drop a torn final row
+            if len(complete) != len(data):
+                with open(results_path, "wb") as f:
+                    f.write(complete)
+            rows = list(csv.reader(io.StringIO(complete.decode())))
+            if rows and rows[0] == RESULT_COLUMNS:
+                done = {row[0] for row in rows[1:]}
+                return done
+
+    with open(results_path, "w", newline="") as f:
+        csv.writer(f).writerow(RESULT_COLUMNS)
+    with open(info_path, "w") as f:
+        json.dump(run_info, f)
+    return done
+
+
+def summarize_results(results_path):
     """
-    Plots a heatmap showing frequency of each letter at each position.
+    Computes summary statistics and the position heatmap from a results CSV.
+    Writes the summary as JSON and the heatmap as CSV and PNG next to the results.
+
+    Args:
+        results_path (str): CSV file written by test_solver_on_all_words.
+
+    Returns:
+        dict: Summary with "total", "solved", "solve_rate", "avg_guesses", "std_guesses",
+            "guess_distribution" and the paths of the files written.
+    """
+    with open(results_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    solved = np.array([row["solved"] == "1" for row in rows], dtype=bool)
+    guesses = np.array([int(row["guesses"]) if row["guesses"] else 0 for row in rows], dtype=np.int64)
+    solved_guesses = guesses[solved]
+    distribution = np.bincount(solved_guesses, minlength=MAX_GUESSES + 1)[1:]
+
+    stem = os.path.splitext(results_path)[0]
+    summary = {
+        "total": len(rows),
+        "solved": int(solved.sum()),
+        "solve_rate": float(solved.mean()) if rows else 0.0,
+        "avg_guesses": float(solved_guesses.mean()) if solved_guesses.size else None,
+        "std_guesses": float(solved_guesses.std()) if solved_guesses.size else None,
+        "guess_distribution": {str(i + 1): int(c) for i, c in enumerate(distribution)},
+        "summary_path": f"{stem}_summary.json",
+        "heatmap_path": f"{stem}_heatmap.png",
+    }
+    with open(summary["summary_path"], "w") as f:
+        json.dump(summary, f, indent=2)
+
+    solved_words = [row["solution"] for row, ok in zip(rows, solved) if ok]
+    generate_position_heatmap(solved_words, summary["heatmap_path"])
+    return summary
+
+
+def position_heatmap_matrix(solved_words):
+    """
+    Computes the frequency of each letter at each position.
+
+    Args:
+        solved_words (list[str]): List of successfully solved words.
+
+    Returns:
+        tuple[np.ndarray, list[str]]: (letters x positions) frequency matrix, normalized per
+            position, and the letters that appear, in row order.
+    """
+    counts = np.zeros((26, WORD_LENGTH), dtype=np.int64)
+    if solved_words:
+        encoded = encode_words(solved_words)
+        np.add.at(counts, (encoded, np.arange(WORD_LENGTH)), 1)
+
+    present = counts.sum(axis=1) > 0
+    alphabet = [ascii_lowercase[i] for i in np.flatnonzero(present)]
+    heat_matrix = counts[present]
+    totals = heat_matrix.sum(axis=0, keepdims=True)
+    return heat_matrix / np.where(totals == 0, 1, totals), alphabet
+
+
+def generate_position_heatmap(solved_words, output_path):
+    """
+    Saves a heatmap showing frequency of each letter at each position.
+    The matrix is written as CSV alongside the PNG; no window is opened.
 
     Args:
         solved_words (list[str]): List of successfully solved words.
+        output_path (str): PNG file to write.
     """
-    position_counts = [defaultdict(int) for _ in range(5)]
-
-    # Count letter occurrences at each position
-    for word in solved_words:
-        for i, char in enumerate(word):
-            position_counts[i][char] += 1
-
-    # Get sorted alphabet and build a matrix
-    alphabet = sorted(set(char for pos in position_counts for char in pos))
-    heat_matrix = np.array([
-        [position_counts[pos].get(char, 0) for pos in range(5)]
-        for char in alphabet
-    ])
-
-    # Normalize to frequencies
-    heat_matrix = heat_matrix / heat_matrix.sum(axis=0, keepdims=True)
-
-    # Plot heatmap
-    plt.figure(figsize=(10, 8))
-    sns.heatmap(heat_matrix, annot=True, cmap='YlGnBu', xticklabels=[f'Pos {i+1}' for i in range(5)], yticklabels=alphabet)
-    plt.title("Letter Frequency Heatmap by Position (Solved Words Only)")
-    plt.xlabel("Letter Position")
-    plt.ylabel("Letter")
-    plt.tight_layout()
-    plt.show()
+    heat_matrix, alphabet = position_heatmap_matrix(solved_words)
+    positions = [f'Pos {i+1}' for i in range(WORD_LENGTH)]
+
+    matrix_path = os.path.splitext(output_path)[0] + ".csv"
+    with open(matrix_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["letter"] + positions)
+        for letter, row in zip(alphabet, heat_matrix):
+            writer.writerow([letter] + [f"{v:.6f}" for v in row])
+
+    if not alphabet:
+        return
+
+    # Plot heatmap off-screen
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    sns.heatmap(heat_matrix, annot=True, cmap='YlGnBu', xticklabels=positions, yticklabels=alphabet, ax=ax)
+    ax.set_title("Letter Frequency Heatmap by Position (Solved Words Only)")
+    ax.set_xlabel("Letter Position")
+    ax.set_ylabel("Letter")
+    fig.tight_layout()
+    fig.savefig(output_path)
+
+
+def evaluate_opener_sets(opener_sets, dictionary, hard_mode=False, max_guesses=MAX_GUESSES, strategy=SCORING_STRATEGY):
+    """
+    Evaluates several opener sets over every answer in one pass.
+    Solutions that receive the same feedback share the rest of their game, so the
+    solution set is split into feedback buckets at each step and each bucket is
+    solved once. Opener sets are walked together like a trie: sets whose next
+    guess and remaining openers agree share a branch, so common prefixes such as
+    AROSE and AROSE + LINTY are only explored once.
+
+    Args:
+        opener_sets (list[list[str]]): Opener sets to compare.
+        dictionary (dict | list[str]): Dictionary from load_dictionary, or a plain list of target words.
+        hard_mode (bool): If True, openers that break a revealed hint are skipped.
+        max_guesses (int): Guesses allowed before a game is lost.
+        strategy (str): Name of the scorer in SCORERS.
+
+    Returns:
+        list[dict]: Per opener set, "openers", "total", "solved", "avg_guesses" and "guess_distribution".
+    """
+    solver = _benchmark_solver(dictionary, (), hard_mode, strategy)  # Openers are walked per branch below
+    answers = solver.dictionary["answers"]
+    histograms = [np.zeros(max_guesses + 1, dtype=np.int64) for _ in opener_sets]  # Index 0 counts failures
+
+    branches = {tuple(openers): [] for openers in opener_sets}
+    for set_index, openers in enumerate(opener_sets):
+        branches[tuple(openers)].append(set_index)
+
+    _evaluate_bucket(answers, solver.new_session(), branches, histograms, max_guesses)
+
+    results = []
+    for openers, histogram in zip(opener_sets, histograms):
+        solved = int(histogram[1:].sum())
+        results.append({
+            "openers": list(openers),
+            "total": len(answers),
+            "solved": solved,
+            "avg_guesses": float(np.dot(np.arange(1, max_guesses + 1), histogram[1:]) / solved) if solved else None,
+            "guess_distribution": {str(i): int(c) for i, c in enumerate(histogram) if i},
+        })
+        print(f"\n📊 Openers: {openers}{' (hard mode)' if hard_mode else ''}")
+        print(f"✅ Solved: {solved}/{len(answers)}")
+        if solved:
+            print(f"Avg Guesses for Solved: {results[-1]['avg_guesses']:.2f}")
+    return results
+
+
+def _evaluate_bucket(solutions, session, branches, histograms, max_guesses):
+    """
+    Recursively plays every solution in a feedback bucket, following the Session policy.
+    Openers are walked here so that opener sets can share branches; once a branch
+    runs out of openers, the session picks the guess exactly as it does in play.
+
+    Args:
+        solutions (list[str]): Solutions that produced the same feedback so far.
+        session (Session): Single-board game without openers, in the state these solutions share.
+        branches (dict[tuple[str, ...], list[int]]): Remaining openers -> indexes of the opener sets in that state.
+        histograms (list[np.ndarray]): Per opener set guess-count histograms; index 0 counts failures.
+        max_guesses (int): Guesses allowed before a game is lost.
+    """
+    board = session.boards[0]
+    guess_index = session.solver.dictionary["guess_index"]
+    hard_mode = session.solver.hard_mode
+    scored = False
+    scored_guess = None
+
+    # Work out each branch's next guess, merging branches that end up in the same state
+    next_branches = {}
+    for remaining, set_indexes in branches.items():
+        # Skip openers that are already guessed or break a hint, as Session does
+        while remaining and (
+            remaining[0] in session.past_guesses
+            or (hard_mode and not mask_contains(guess_index, board["legal_mask"], remaining[0]))
+        ):
+            remaining = remaining[1:]
+        if remaining and not board["solved"]:
+            guess, remaining = remaining[0], remaining[1:]
+        else:
+            if not scored:
+                scored_guess, scored = session.next_guess(), True
+            guess = scored_guess
+            if guess is None:
+                for set_index in set_indexes:
+                    histograms[set_index][0] += len(solutions)  # No valid guesses left
+                continue
+        next_branches.setdefault(guess, {}).setdefault(remaining, []).extend(set_indexes)
+
+    for guess, guess_branches in next_branches.items():
+        depth = session.guess_count + 1
+        buckets = {}
+        for solution, feedback in zip(solutions, feedback_for_solutions(solutions, guess)):
+            buckets.setdefault(feedback, []).append(solution)
+
+        for feedback, bucket in buckets.items():
+            if feedback == WIN_FEEDBACK:
+                for set_indexes in guess_branches.values():
+                    for set_index in set_indexes:
+                        histograms[set_index][depth] += len(bucket)
+            elif depth >= max_guesses:
+                for set_indexes in guess_branches.values():
+                    for set_index in set_indexes:
+                        histograms[set_index][0] += len(bucket)
+            else:
+                child = session.copy()
+                child.record_guess(guess)
+                child.record_feedback(0, guess, feedback)
+                _evaluate_bucket(bucket, child, guess_branches, histograms, max_guesses)
+
+
+def estimate_solver_performance(openers, dictionary, sample_size=DEFAULT_SAMPLE_SIZE, seed=0, stratify="feedback",
+                                confidence=0.95, target_width=None, target_rate_width=None, max_sample_size=None,
+                                hard_mode=False, table=None, strategy=SCORING_STRATEGY):
+    """
+    Estimates solve rate and average guesses from a stratified random sample of solutions.
+    Solutions are grouped into strata, sampled proportionally with a fixed seed, and
+    combined with stratified estimators. With a target width, more batches of
+    sample_size are drawn until the confidence intervals are narrow enough.
+
+    Args:
+        openers (list[str]): List of initial guesses to use before switching to scoring.
+        dictionary (dict | list[str]): Dictionary from load_dictionary, or a plain list of target words.
+        sample_size (int): Solutions drawn per batch.
+        seed (int): Seed for the random sample.
+        stratify (str): "feedback" to group by the first opener's feedback, or "pattern"
+            to group by vowel/consonant pattern. Without openers, "feedback" falls back to "pattern".
+        confidence (float): Confidence level of the intervals.
+        target_width (float | None): Keep sampling until the average-guesses interval is at most this wide.
+        target_rate_width (float | None): Keep sampling until the solve-rate interval is at most this wide.
+        max_sample_size (int | None): Upper bound on solutions played; defaults to all of them.
+        hard_mode (bool): If True, openers that break a revealed hint are skipped.
+        table (TranspositionTable | None): Shared cache of next-guess results.
+        strategy (str): Name of the scorer in SCORERS.
+
+    Returns:
+        dict: "sampled", "total", "solve_rate", "solve_rate_ci", "avg_guesses", "avg_guesses_ci",
+            and "stratify" (the stratification actually used).
+    """
+    solver = _benchmark_solver(dictionary, openers, hard_mode, strategy, table)
+    answers = list(solver.dictionary["answers"])
+    total = len(answers)
+    max_sample_size = min(max_sample_size or total, total)
+    if stratify == "feedback" and not openers:
+        stratify = "pattern"  # There is no first opener to take feedback from
+
+    # Group solutions into strata and shuffle each one with the fixed seed
+    strata = _stratify(answers, openers, stratify, min_size=-(-2 * total // min(sample_size, max_sample_size)))
+    rng = random.Random(seed)
+    for members in strata.values():
+        rng.shuffle(members)
+    outcomes = {key: [] for key in strata}  # Per stratum: (solved, guesses) pairs
+
+    target = min(sample_size, max_sample_size)
+    while True:
+        allocation = _allocate(target, {key: len(members) for key, members in strata.items()})
+        for key, members in strata.items():
+            for solution in members[len(outcomes[key]):max(allocation[key], len(outcomes[key]))]:
+                outcome = play_solution(solution, solver)
+                outcomes[key].append((outcome["solved"], outcome["guesses"] or 0))
+
+        estimate = _stratified_estimate(strata, outcomes, total, confidence)
+        rate_width = estimate["solve_rate_ci"][1] - estimate["solve_rate_ci"][0]
+        avg_width = estimate["avg_guesses_ci"][1] - estimate["avg_guesses_ci"][0]
+        narrow_enough = (
+            (target_width is None or avg_width <= target_width)
+            and (target_rate_width is None or rate_width <= target_rate_width)
+        )
+        if narrow_enough or target >= max_sample_size:
+            break
+        target = min(target + sample_size, max_sample_size)
+
+    estimate["stratify"] = stratify
+    print(f"\n📊 Estimate for Openers: {openers}{' (hard mode)' if hard_mode else ''}")
+    print(f"🎲 Sampled {estimate['sampled']}/{total} words (stratified by {stratify}, seed {seed})")
+    print(f"✅ Solve rate: {estimate['solve_rate']:.1%} ± {rate_width / 2:.1%} ({confidence:.0%} CI)")
+    print(f"Avg Guesses for Solved: {estimate['avg_guesses']:.2f} ± {avg_width / 2:.2f} ({confidence:.0%} CI)")
+    return estimate
+
+
+def _stratify(answers, openers, stratify, min_size=1):
+    """
+    Groups solutions into strata. Strata smaller than min_size are merged into one
+    "other" stratum so that every stratum gets at least two draws per batch.
+
+    Args:
+        answers (list[str]): Solutions to group.
+        openers (list[str]): Opener set; the first opener defines the feedback strata.
+        stratify (str): "feedback" or "pattern".
+        min_size (int): Smallest stratum kept on its own.
+
+    Returns:
+        dict[str, list[str]]: Stratum key -> solutions.
+
+    Raises:
+        ValueError: If the stratification is unknown, or "feedback" is asked for without openers.
+    """
+    if stratify == "feedback":
+        if not openers:
+            raise ValueError("Feedback stratification needs at least one opener.")
+        keys = feedback_for_solutions(answers, openers[0])
+    elif stratify == "pattern":
+        keys = [''.join('v' if ch in "aeiou" else 'c' for ch in word) for word in answers]
+    else:
+        raise ValueError(f"Unknown stratification: {stratify!r}")
+
+    strata = {}
+    for key, solution in zip(keys, answers):
+        strata.setdefault(key, []).append(solution)
+
+    merged = {}
+    for key, members in strata.items():
+        merged.setdefault(key if len(members) >= min_size else "other", []).extend(members)
+    return merged
+
+
+def _allocate(target, sizes):
+    """
+    Splits a sample size across strata in proportion to their sizes (largest remainder).
+
+    Args:
+        target (int): Total solutions to draw.
+        sizes (dict[str, int]): Stratum key -> number of solutions.
+
+    Returns:
+        dict[str, int]: Stratum key -> solutions to draw.
+    """
+    total = sum(sizes.values())
+    quotas = {key: target * size / total for key, size in sizes.items()}
+    allocation = {key: int(quota) for key, quota in quotas.items()}
+    leftover = target - sum(allocation.values())
+    for key in sorted(quotas, key=lambda k: quotas[k] - allocation[k], reverse=True)[:leftover]:
+        allocation[key] += 1
+    return allocation
+
+
+def _stratified_estimate(strata, outcomes, total, confidence):
+    """
+    Combines per-stratum outcomes into stratified estimates with normal confidence intervals.
+    The average-guesses estimate is a ratio estimator (guesses over solved) with a
+    linearized variance. Strata with a single draw borrow the pooled within-stratum variance.
+
+    Args:
+        strata (dict[str, list[str]]): Stratum key -> all solutions in the stratum.
+        outcomes (dict[str, list[tuple[bool, int]]]): Stratum key -> (solved, guesses) drawn so far.
+        total (int): Number of solutions overall.
+        confidence (float): Confidence level of the intervals.
+
+    Returns:
+        dict: "sampled", "total", "solve_rate", "solve_rate_ci", "avg_guesses", "avg_guesses_ci".
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    drawn = {key: np.array(rows, dtype=np.float64).reshape(-1, 2) for key, rows in outcomes.items() if rows}
+    weights = {key: len(strata[key]) / total for key in drawn}
+    covered = sum(weights.values())  # Strata with no draws yet are left out and re-weighted
+
+    rate = sum(weights[key] * rows[:, 0].mean() for key, rows in drawn.items()) / covered
+    mean_guesses = sum(weights[key] * rows[:, 1].mean() for key, rows in drawn.items()) / covered
+    avg = mean_guesses / rate if rate else float("nan")
+
+    def variance(values_by_key):
+        per_stratum = {key: values.var(ddof=1) for key, values in values_by_key.items() if len(values) > 1}
+        pooled = float(np.mean(list(per_stratum.values()))) if per_stratum else 0.0
+        result = 0.0
+        for key, values in values_by_key.items():
+            n, size = len(values), len(strata[key])
+            result += (weights[key] / covered) ** 2 * (1 - n / size) * per_stratum.get(key, pooled) / n
+        return result
+
+    rate_se = variance({key: rows[:, 0] for key, rows in drawn.items()}) ** 0.5
+    avg_se = (variance({key: rows[:, 1] - avg * rows[:, 0] for key, rows in drawn.items()}) ** 0.5 / rate) if rate else float("nan")
+
+    return {
+        "sampled": int(sum(len(rows) for rows in drawn.values())),
+        "total": total,
+        "solve_rate": float(rate),
+        "solve_rate_ci": (float(max(rate - z * rate_se, 0.0)), float(min(rate + z * rate_se, 1.0))),
+        "avg_guesses": float(avg),
+        "avg_guesses_ci": (float(avg - z * avg_se), float(avg + z * avg_se)),
+    }
+
+
+def compare_backends(dictionary, num_guesses=10, seed=0):
+    """
+    Checks that the compiled kernels agree with their reference implementations.
+    The feedback-code matrix used by the endgame search is compared for every
+    allowed guess against every answer, a block of answers at a time. Feedback
+    strings, filtering of every answer for each resulting feedback pattern, and
+    scoring are compared for the default openers plus a random sample of guesses.
+
+    Args:
+        dictionary (dict | list[str]): Dictionary from load_dictionary, or a plain word list.
+        num_guesses (int): Number of randomly chosen guesses to check, besides the default openers.
+        seed (int): Seed for choosing the guesses.
+
+    Returns:
+        bool | None: True if both backends gave identical results, False if not,
+            or None if Numba is not installed and there is nothing to compare.
+    """
+    if not NUMBA_AVAILABLE:
+        print("⚠️ Numba is not installed; only the Python backend is available.")
+        return None
+
+    dictionary = as_dictionary(dictionary)
+    answers = dictionary["answers"]
+    guesses = [word for word in ("arose", "linty", "chump") if word in dictionary["guess_index"]["positions"]]
+    guesses += random.Random(seed).sample(dictionary["guesses"], min(num_guesses, len(dictionary["guesses"])))
+    mismatches = 0
+
+    if score_words(answers, backend="numba") != score_words(answers, backend="python"):
+        print("❌ Scores differ between backends.")
+        mismatches += 1
+
+    for guess in guesses:
+        feedbacks = feedback_for_solutions(answers, guess, backend="numba")
+        if feedbacks != feedback_for_solutions(answers, guess, backend="python"):
+            print(f"❌ Feedback differs between backends for {guess.upper()}.")
+            mismatches += 1
+        for feedback in sorted(set(feedbacks)):
+            if filter_words(answers, guess, feedback, backend="numba") != filter_words(answers, guess, feedback, backend="python"):
+                print(f"❌ Filtering differs between backends for {guess.upper()} / {feedback}.")
+                mismatches += 1
+
+    encoded_guesses, encoded_answers = encode_words(dictionary["guesses"]), encode_words(answers)
+    for start in range(0, len(answers), BACKEND_CHECK_CHUNK):
+        block = encoded_answers[start:start + BACKEND_CHECK_CHUNK]
+        if not np.array_equal(
+            feedback_matrix(encoded_guesses, block, backend="numba"),
+            feedback_matrix(encoded_guesses, block, backend="python")
+        ):
+            print(f"❌ Feedback matrices differ between backends for answers {start}-{start + len(block) - 1}.")
+            mismatches += 1
+
+    print(
+        f"✅ Backends agree: feedback matrix over {len(dictionary['guesses'])} guesses x {len(answers)} answers, "
+        f"feedback, filtering and scoring over {len(guesses)} guesses."
+        if not mismatches else f"❌ {mismatches} mismatches found."
+    )
+    return mismatches == 0
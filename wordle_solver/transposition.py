@@ -0,0 +1,168 @@
+# transposition.py
+"""
+Persistent transposition table for next-guess results.
+Maps a canonical solver state to the chosen guess and its score in an SQLite
+database (WAL mode), so separate solver processes can share the work.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from wordle_solver.constants import TRANSPOSITION_TABLE_PATH, TRANSPOSITION_TABLE_MAX_ENTRIES
+
+EVICT_EVERY = 256  # Inserts between size checks
+TOUCH_AFTER = 60.0  # Seconds before a hit refreshes an entry's last-used time
+
+
+def fingerprint(words):
+    """
+    Hashes a word list, order included.
+
+    Args:
+        words (list[str]): Words to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    return hashlib.sha1("\n".join(words).encode("ascii")).hexdigest()
+
+
+def state_key(word_list_hash, strategy, candidate_sets, past_guesses=()):
+    """
+    Builds the canonical key for a solver state.
+    Boards are sorted by fingerprint, so the same boards in a different order share a key.
+
+    Args:
+        word_list_hash (str): Fingerprint of the list of words being ranked.
+        strategy (str): Name of the scoring strategy.
+        candidate_sets (list[list[str]]): Remaining candidates per board.
+        past_guesses (list[str]): Words already guessed (excluded from ranking).
+
+    Returns:
+        str: Hex digest identifying the state.
+    """
+    boards = sorted(fingerprint(words) for words in candidate_sets)
+    parts = [word_list_hash, strategy, ",".join(boards), ",".join(sorted(set(past_guesses)))]
+    return hashlib.sha1("|".join(parts).encode("ascii")).hexdigest()
+
+
+class TranspositionTable:
+    """
+    Size-bounded SQLite cache of next-guess results.
+    Each thread gets its own connection; WAL mode lets many processes read
+    while one writes. The least recently used entries are evicted once the
+    table grows past max_entries.
+    """
+
+    def __init__(self, path=TRANSPOSITION_TABLE_PATH, max_entries=TRANSPOSITION_TABLE_MAX_ENTRIES):
+        """
+        Opens (or creates) the table.
+
+        Args:
+            path (str): SQLite database file.
+            max_entries (int): Entries kept before least recently used ones are evicted.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._inserts = 0
+        self._lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, guess TEXT NOT NULL, score REAL, last_used REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+
+    def _connection(self):
+        """Returns this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        """
+        Looks up a state.
+
+        Args:
+            key (str): Key from state_key.
+
+        Returns:
+            tuple[str, float] | None: (guess, score), or None on a miss.
+        """
+        conn = self._connection()
+        row = conn.execute("SELECT guess, score, last_used FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[2] > TOUCH_AFTER:
+            conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+        return row[0], row[1]
+
+    def put(self, key, guess, score):
+        """
+        Stores the result for a state, evicting old entries when the table is full.
+
+        Args:
+            key (str): Key from state_key.
+            guess (str): Chosen guess.
+            score (float): Score of the chosen guess.
+        """
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (key, guess, score, last_used) VALUES (?, ?, ?, ?)",
+            (key, guess, score, time.time())
+        )
+        with self._lock:
+            self._inserts += 1
+            check = self._inserts % EVICT_EVERY == 0
+        if check:
+            self.evict()
+
+    def evict(self):
+        """Deletes the least recently used entries beyond max_entries."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_used LIMIT ?)",
+                    (excess,)
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def __len__(self):
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()
+        return count
+
+    def close(self):
+        """Closes this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def open_transposition_table(path=TRANSPOSITION_TABLE_PATH):
+    """
+    Opens the configured transposition table, if any.
+
+    Args:
+        path (str | None): SQLite database file, or None to disable the table.
+
+    Returns:
+        TranspositionTable | None: The table, or None when disabled.
+    """
+    return TranspositionTable(path) if path else None